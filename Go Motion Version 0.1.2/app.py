@@ -1,183 +1,64 @@
 import streamlit as st
-from streamlit_option_menu import option_menu
-from streamlit_lottie import st_lottie
+import article_store
+import assets
 import auth
-import pickle
-import requests
-import re
-from PIL import Image
-import sqlite3
-import plotly.express as px
-import plotly.graph_objects as go
-
-# Fungsi untuk memuat animasi Lottie dari URL
-def load_lottie_url(url):
-    r = requests.get(url)
-    if r.status_code != 200:
-        return None
-    return r.json()
-
-# Fungsi untuk memuat model machine learning
-def load_model():
-    with open("obesity_classifier.pkl", "rb") as file:
-        obesity_classifier = pickle.load(file) 
-    return obesity_classifier
-
-# CSS untuk latar belakang, gaya, dan animasi
-# CSS untuk latar belakang, gaya, dan animasi
+import metrics
+import migrations
+import model_registry
+import sessions
+import settings
+import styles
+import throttle
+import thumbnails
+from validators import check_uppercase, check_lowercase, check_digit, check_no_symbols, is_valid_password, is_valid_email
+import functools
+import inspect
+import io
+import secrets
+import time
+
+# Dependensi berat (plotly, streamlit_lottie, streamlit_option_menu, dan modul ML yang memuat numpy/CatBoost:
+# features, inference_server, prediction_cache, explain, whatif, preview) serta modul yang hanya dipakai
+# signup/login/admin (credential_service, bulk_users) diimpor di fungsi yang memakainya, jadi proses baru
+# bisa menampilkan halaman landing tanpa memuat semuanya.
+# Profil impor dan benchmark start-up: python startup.py importtime / python startup.py benchmark
+
+# Fragment Streamlit (rerun hanya sebagian halaman); di versi lama jatuh ke fungsi biasa
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+# st.rerun; st.experimental_rerun hanya ada di versi lama (dihapus di Streamlit baru)
+rerun = getattr(st, "rerun", None) or getattr(st, "experimental_rerun")
+
+# Gambar selebar kolom. Sejak Streamlit 1.61 use_column_width diabaikan (gambar tidak lagi melebar) dan
+# hanya memunculkan peringatan deprecasi; versi baru memakai width="stretch"
+IMAGE_STRETCH = ({"width": "stretch"} if inspect.signature(st.image).parameters["width"].default == "content"
+                 else {"use_column_width": True})
+
+# Setiap halaman dijalankan sebagai fragment: interaksi di dalam halaman (selectbox, tombol, form) hanya
+# menjalankan ulang fungsi halaman itu, bukan main() dengan CSS, menu sidebar, dan dispatch halaman.
+# Navigasi lewat menu dan rerun() tetap rerun penuh. Waktu setiap run dicatat di
+# metrics: "script" untuk rerun penuh, "page:<nama>" untuk run halaman (termasuk rerun fragment).
+def page(name):
+    timer = metrics.timer(f"page:{name}")
+
+    def decorator(render):
+        @fragment
+        @functools.wraps(render)
+        def run():
+            with timer.time():
+                render()
+        return run
+    return decorator
+
+# CSS untuk latar belakang, gaya, dan animasi. Tetap harus dikirim di setiap rerun penuh (Streamlit
+# membuang elemen yang tidak dirender ulang), tapi sebagai satu blok <style> siap pakai dari styles.py;
+# rerun fragment halaman tidak mengirimnya sama sekali.
 def load_css():
-    st.markdown(
-        """
-        <style>
-        .stApp {
-            background-image: url("https://r4.wallpaperflare.com/wallpaper/707/220/899/gradient-blue-pink-abstract-art-wallpaper-a33b436d2de9cbc5dfa6225748ab3818.jpg");
-            background-size: cover;
-            background-repeat: no-repeat;
-            background-attachment: fixed;
-            transition: background 0.5s ease;
-            color: #ffffff; /* Warna putih */
-        }
-        .title-box {
-            text-align: center;
-            margin-top: 2rem;
-            animation: fadeInDown 1s ease;
-        }
-        .title-box h1 {
-            font-size: 3rem;
-            color: #ffffff; /* Warna putih */
-            text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.5); /* Efek bayangan */
-            margin: 0;
-        }
-        .info-box {
-            text-align: center;
-            margin-top: 2rem;
-            color: #ffffff; /* Warna putih */
-            background: rgba(0, 0, 0, 0.7); /* Warna hitam transparan */
-            padding: 1rem;
-            border-radius: 1rem;
-            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2); /* Bayangan */
-            animation: fadeInUp 1s ease;
-        }
-        .center-buttons {
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            margin-top: 4rem;
-        }
-        .center-buttons button {
-            font-weight: bold;
-            font-size: 1.1rem;
-            padding: 0.5rem 1rem;
-            background-color: #ff69b4; /* Warna pink */
-            color: white;
-            border: none;
-            border-radius: 5px;
-            cursor: pointer;
-            margin: 0 0.5rem;
-            transition: background-color 0.3s ease, transform 0.3s ease; /* Efek transisi */
-            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2); /* Bayangan */
-        }
-        .center-buttons button:hover {
-            background-color: #ff1493; /* Warna pink lebih gelap */
-            transform: scale(1.05); /* Efek perbesaran */
-        }
-        .center-buttons button:active {
-            transform: scale(0.95); /* Efek pengecilan saat diklik */
-        }
-        .extra-box {
-            text-align: center;
-            margin-top: 1rem;
-            color: #ffffff; /* Warna putih */
-            background: rgba(0, 0, 0, 0.7); /* Warna hitam transparan */
-            padding: 1rem;
-            border-radius: 1rem;
-            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2); /* Bayangan */
-            animation: fadeIn 1.5s ease;
-        }
-        .top-menu {
-            display: flex;
-            justify-content: flex-end;
-            background: rgba(0, 0, 0, 0.7); /* Warna hitam transparan */
-            padding: 0.5rem 1rem;
-            position: sticky;
-            top: 0;
-            z-index: 1000;
-            animation: slideDown 0.5s ease;
-        }
-        .top-menu a {
-            color: #fff;
-            margin: 0 1rem;
-            text-decoration: none;
-            font-weight: bold;
-            transition: color 0.3s ease; /* Efek transisi */
-        }
-        .top-menu a:hover {
-            color: #ff69b4; /* Warna pink */
-        }
-        .button-container {
-            display: flex;
-            justify-content: center;
-            margin-top: 4rem;
-        }
-        .button-container .stButton {
-            margin: 0 0.5rem;
-        }
-        .article-container {
-            background: rgba(50, 50, 50, 0.9);
-            border-radius: 10px;
-            padding: 10px;
-            margin-top: 10px;
-            text-align: center;
-            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2); /* Bayangan */
-            animation: fadeIn 1.5s ease;
-        }
-        .article-container img {
-            border-radius: 10px;
-            transition: transform 0.3s ease; /* Efek transisi */
-        }
-        .article-container img:hover {
-            transform: scale(1.05); /* Efek perbesaran */
-        }
-        /* Animasi */
-        @keyframes fadeIn {
-            from { opacity: 0; }
-            to { opacity: 1; }
-        }
-        @keyframes fadeInDown {
-            from { opacity: 0; transform: translateY(-20px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-        @keyframes fadeInUp {
-            from { opacity: 0; transform: translateY(20px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-        @keyframes slideDown {
-            from { opacity: 0; transform: translateY(-50px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-        </style>
-        """, unsafe_allow_html=True
-    )
-
-
-# Fungsi Validasi
-def check_uppercase(password):
-    return any(c.isupper() for c in password)
-
-def check_lowercase(password):
-    return any(c.islower() for c in password)
-
-def check_digit(password):
-    return any(c.isdigit() for c in password)
-
-def check_no_symbols(password):
-    return password.isalnum()
-
-def is_valid_password(password):
-    return check_uppercase(password) and check_lowercase(password) and check_digit(password) and check_no_symbols(password)
-
-def is_valid_email(email):
-    return email.endswith('@gmail.com')
+    # Gambar latar disajikan dari cache aset lokal lewat static serving (.streamlit/config.toml), bukan
+    # langsung dari CDN; tanpa static serving tetap pakai URL aslinya
+    background = (assets.background_url() if st.get_option("server.enableStaticServing")
+                  else assets.ASSETS["background"])
+    st.markdown(styles.stylesheet(background), unsafe_allow_html=True)
 
 
 # Fungsi untuk menyimpan artikel yang diunggah
@@ -191,11 +72,8 @@ def save_article(title, description, image, link):
         "link": link
     })
 
-# Fungsi untuk membuat koneksi ke database
-def create_connection():
-    return sqlite3.connect('users.db')
-
 # Halaman registrasi
+@page("signup")
 def signup():
     st.title("Sign Up")
 
@@ -227,14 +105,109 @@ def signup():
             elif role == 'admin':
                 st.error("Cannot sign up with admin role")
             else:
-                auth.create_user(email, password, role)
-                st.success("User created successfully")
+                import credential_service
+                try:
+                    auth.create_user(email, password, role)
+                    st.success("User created successfully")
+                except credential_service.ServiceBusy as exc:
+                    st.error(str(exc))
 
     if st.button("Back"):
         st.session_state['page'] = 'landing'
-        st.experimental_rerun()
+        rerun()
+
+# Sesi login disimpan sebagai token bertanda tangan di cookie (bukan di URL, yang ikut tersalin lewat link,
+# screenshot, dan riwayat browser) supaya tetap ada saat browser di-refresh. Cookie dibaca dari
+# st.context.cookies saat sesi websocket baru dimulai dan ditulis lewat komponen HTML kecil.
+def start_session(email, role):
+    token = sessions.create(email, role)
+    st.session_state['logged_in'] = True
+    st.session_state['email'] = email
+    st.session_state['role'] = role
+    st.session_state['session_token'] = token
+    st.session_state['session_checked_at'] = time.time()
+    st.session_state['session_cookie'] = (token, int(settings.SESSION_TTL))
+
+def restore_session():
+    # Link lama dengan ?session=... tidak lagi diterima; buang supaya token tidak ikut tersalin
+    query_params = getattr(st, "query_params", None)
+    if query_params is not None and "session" in query_params:
+        del query_params["session"]
+    cookies = getattr(getattr(st, "context", None), "cookies", None) or {}
+    token = cookies.get(settings.SESSION_COOKIE)
+    # st.context.cookies adalah snapshot saat websocket dibuka, jadi cookie yang sudah ditolak (atau
+    # yang baru saja di-logout) tetap terlihat di setiap rerun; jangan cek ulang atau hapus lagi
+    if not token or token == st.session_state.get('rejected_session_token'):
+        return
+    user = sessions.resolve(token)
+    if user:
+        st.session_state['logged_in'] = True
+        st.session_state['email'], st.session_state['role'] = user
+        st.session_state['session_token'] = token
+        st.session_state['session_checked_at'] = time.time()
+    else:
+        st.session_state['rejected_session_token'] = token
+        st.session_state['session_cookie'] = ("", 0)
+
+# Sesi yang sedang terbuka dicek ulang secara berkala, jadi logout di tab lain, perubahan role, atau
+# akun yang dihapus juga mengakhiri sesi websocket yang masih aktif
+def check_session():
+    now = time.time()
+    if now < st.session_state.get('session_checked_at', 0) + settings.SESSION_CHECK_SECONDS:
+        return
+    st.session_state['session_checked_at'] = now
+    user = sessions.resolve(st.session_state.get('session_token'))
+    if user != (st.session_state.get('email'), st.session_state.get('role')):
+        end_session()
+        st.session_state['page'] = 'landing'
+
+def end_session():
+    token = st.session_state.pop('session_token', None)
+    sessions.invalidate(token)
+    st.session_state['rejected_session_token'] = token
+    st.session_state['session_cookie'] = ("", 0)
+    st.session_state['logged_in'] = False
+
+# Tulis/hapus cookie sesi di browser. Dipanggil di awal run penuh berikutnya (bukan di dalam form login),
+# karena rerun() sesudah login akan membuang komponen sebelum sempat dijalankan.
+def write_session_cookie():
+    pending = st.session_state.pop('session_cookie', None)
+    if pending is None:
+        return
+    import json
+    import streamlit.components.v1 as components
+    value, max_age = pending
+    cookie = f"{settings.SESSION_COOKIE}={value}; Path=/; Max-Age={max_age}; SameSite=Strict"
+    components.html(f"""<script>
+        const secure = window.parent.location.protocol === "https:" ? "; Secure" : "";
+        window.parent.document.cookie = {json.dumps(cookie)} + secure;
+        </script>""", height=0)
+
+# Identitas klien untuk pembatasan login: IP peer koneksi. X-Forwarded-For hanya dipakai kalau server
+# ada di belakang proxy tepercaya (GOMOTION_TRUSTED_PROXY_HOPS), dan yang diambil alamat yang ditambahkan
+# proxy kita sendiri (dihitung dari kanan), bukan nilai pertama yang bisa diisi bebas oleh klien.
+def client_id():
+    ip = peer_ip()
+    hops = settings.TRUSTED_PROXY_HOPS
+    if hops:
+        headers = getattr(getattr(st, "context", None), "headers", None) or {}
+        forwarded = [part.strip() for part in headers.get("X-Forwarded-For", "").split(",") if part.strip()]
+        if len(forwarded) >= hops:
+            ip = forwarded[-hops]
+    if ip:
+        return ip
+    # Tanpa IP (misalnya koneksi dari localhost) pakai id acak per sesi Streamlit
+    if 'client_id' not in st.session_state:
+        st.session_state['client_id'] = f"session:{secrets.token_hex(8)}"
+    return st.session_state['client_id']
+
+# Alamat IP peer koneksi websocket sesi ini, dari API publik st.context.ip_address
+def peer_ip():
+    ip = getattr(getattr(st, "context", None), "ip_address", None)
+    return ip if isinstance(ip, str) and ip else None
 
 # Halaman login
+@page("login")
 def login():
     st.title("Login")
 
@@ -251,23 +224,31 @@ def login():
                 st.error("Email harus diakhiri dengan @gmail.com")
             elif not is_valid_password(password):
                 st.error("Password harus mengandung huruf besar, huruf kecil, dan angka. Tidak boleh ada simbol.")
+            elif not throttle.allow_login(email, client_id()):
+                st.error("Too many login attempts. Please wait a moment and try again.")
             else:
-                user = auth.check_credentials(email, password, role)
+                import credential_service
+                try:
+                    user = auth.check_credentials(email, password, role)
+                except credential_service.ServiceBusy as exc:
+                    st.error(str(exc))
+                    return
                 if user:
                     st.success("Login successful")
-                    st.session_state['logged_in'] = True
-                    st.session_state['email'] = email
-                    st.session_state['role'] = user[3]
-                    st.experimental_rerun()
+                    start_session(email, user[3])
+                    rerun()
                 else:
                     st.error("Invalid email or password")
 
     if st.button("Back"):
         st.session_state['page'] = 'landing'
-        st.experimental_rerun()
+        rerun()
 
 # Halaman utama setelah login
+@page("Home")
 def main_page():
+    import plotly.express as px
+
     st.title("Welcome to Go Motion Dashboard")
     st.write(f"Hello, {st.session_state['email']}! You are logged in as {st.session_state['role']}.")
 
@@ -305,17 +286,49 @@ def main_page():
     st.write("Dashboard ini memberikan gambaran umum tentang data pengguna dan distribusi kategori BMI.")
 
     if st.button("Logout"):
-        st.session_state['logged_in'] = False
-        st.experimental_rerun()
+        end_session()
+        rerun()
         
 
 # Halaman artikel
+@page("Articles")
 def articles_page():
     st.title("Articles")
     st.write("Here are some interesting articles for you to read.")
-    display_articles()
+    query = st.text_input("Search articles", placeholder="e.g. olahraga, kolesterol")
+    if query.strip():
+        display_search_results(query)
+    else:
+        display_articles()
+
+# Hasil pencarian artikel (FTS5), terurut relevansi dan dibagi per halaman
+@fragment
+def display_search_results(query):
+    if st.session_state.get('search_query') != query:
+        st.session_state['search_query'] = query
+        st.session_state['search_offset'] = 0
+    offset = st.session_state['search_offset']
+    results, has_more = article_store.search(query, offset)
+    if not results:
+        st.info("No articles match your search.")
+        return
+
+    for article in results:
+        st.markdown(f"### {article[5]}")
+        st.image(thumbnails.image(article[3]), width=320)
+        st.markdown(article[6])
+        st.markdown(f"[Read more]({article[4]})")
+
+    page_size = settings.ARTICLES_PAGE_SIZE
+    col1, col2, col3 = st.columns([1, 2, 1])
+    col1.button("Previous results", disabled=offset == 0,
+                on_click=st.session_state.__setitem__, args=('search_offset', max(0, offset - page_size)))
+    col2.caption(f"Results {offset + 1}-{offset + len(results)}")
+    col3.button("More results", disabled=not has_more,
+                on_click=st.session_state.__setitem__, args=('search_offset', offset + page_size))
 
 # Halaman Video Workout
+@page("Workout Video")
 def video_page():
     st.title("Workout Videos")
     
@@ -355,65 +368,155 @@ def video_page():
     st.write(recommendations.get(bmi_category, "Select a BMI category to see recommendations."))
  
 
+# Widget input klasifikasi, dipakai oleh form maupun live preview
+def obesity_inputs():
+    return {
+        "age": st.slider("Age", min_value=1, max_value=120),
+        "gender": st.selectbox("Gender", ["Male", "Female"]),
+        "height": st.slider("Height (in meters)", min_value=0.5, max_value=2.5, step=0.01),
+        "weight": st.slider("Weight (in kg)", min_value=20, max_value=200),
+        "calc": st.selectbox("How often do you drink alcohol?", ["Never", "Sometimes", "Frequently", "Always"]),
+        "favc": st.selectbox("Do you eat high caloric food frequently?", ["No", "Yes"]),
+        "fcvc": st.slider("Do you usually eat vegetables in your meals?", min_value=0, max_value=10),
+        "ncp": st.slider("How many main meals do you have daily?", min_value=0, max_value=10),
+        "scc": st.selectbox("Do you monitor the calories you eat daily?", ["No", "Yes"]),
+        "smoke": st.selectbox("Do you smoke?", ["No", "Yes"]),
+        "ch20": st.slider("How much water do you drink daily? (in liters)", min_value=0.0, max_value=10.0, step=0.1),
+        "fhwo": st.selectbox("Family History With Overweight", ["No", "Yes"]),
+        "faf": st.slider("How often do you have physical activity? (days per week)", min_value=0, max_value=7),
+        "tue": st.slider("How much time do you use technological devices daily? (in hours)", min_value=0, max_value=24),
+        "caec": st.selectbox("Do you eat any food between meals?", ["No", "Sometimes", "Frequently", "Always"]),
+        "mtrans": st.selectbox("Which transportation do you usually use?", ["Automobile", "Motorbike", "Bike", "Public Transportation", "Walking"]),
+    }
+
+# Live preview: hanya fragment ini yang di-rerun saat slider berubah, bukan seluruh halaman
+@fragment
+def live_preview():
+    import plotly.express as px
+    import features
+    import preview
+
+    values = obesity_inputs()
+    try:
+        row = features.encoder.encode(values)
+    except ValueError as exc:
+        st.error(f"Invalid input: {exc}")
+        return
+
+    preview.debounce(st.session_state)
+    result_area = st.container()
+    (prediction, probabilities), elapsed = preview.predict(row)
+
+    with result_area:
+        col1, col2 = st.columns(2)
+        col1.metric("Predicted health status", features.HEALTH_STATUSES[int(prediction)])
+        col2.metric("BMI", f"{values['weight'] / values['height'] ** 2:.2f}")
+        fig = px.bar(x=list(features.HEALTH_STATUSES), y=probabilities, labels={"x": "Category", "y": "Probability"},
+                     template='plotly_dark')
+        fig.update_layout(height=300, plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)')
+        st.plotly_chart(fig, use_container_width=True)
+        stats = preview.stats()
+        st.caption(f"Preview inference {elapsed * 1000:.1f} ms · p50 {stats['p50_ms']:.1f} ms, "
+                   f"p99 {stats['p99_ms']:.1f} ms (budget {stats['budget_ms']:.0f} ms)")
+
+# Panel what-if: heatmap kategori prediksi untuk dua fitur, dihitung dengan satu panggilan batch
+@fragment
+def whatif_panel():
+    import plotly.graph_objects as go
+    import features
+    import whatif
+
+    st.write("### What if?")
+    values = st.session_state['last_features']
+    col1, col2 = st.columns(2)
+    x_name = col1.selectbox("Horizontal axis", features.NUMERIC_FEATURES, index=features.NUMERIC_FEATURES.index("faf"))
+    y_name = col2.selectbox("Vertical axis", features.NUMERIC_FEATURES, index=features.NUMERIC_FEATURES.index("weight"))
+    try:
+        xs, ys, labels, elapsed = whatif.grid(features.encoder.encode(values), x_name, y_name)
+    except ValueError as exc:
+        st.error(str(exc))
+        return
+
+    fig = go.Figure(go.Heatmap(
+        z=labels, x=xs, y=ys, zmin=0, zmax=len(features.HEALTH_STATUSES) - 1, colorscale='RdPu',
+        colorbar=dict(tickvals=list(range(len(features.HEALTH_STATUSES))), ticktext=list(features.HEALTH_STATUSES)),
+        hovertemplate=f"{x_name}=%{{x}}<br>{y_name}=%{{y}}<extra></extra>",
+    ))
+    fig.add_trace(go.Scatter(x=[values[x_name]], y=[values[y_name]], mode='markers', name='You',
+                             marker=dict(color='white', size=12, symbol='x')))
+    fig.update_layout(xaxis_title=x_name, yaxis_title=y_name, template='plotly_dark',
+                      plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)')
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption(f"{labels.size} scenarios scored in {elapsed * 1000:.1f} ms")
+
 # Halaman klasifikasi obesitas
+@page("Check Your Condition")
 def obesity_classification_page():
+    import plotly.express as px
+    import explain
+    import features
+    import inference_server
+    import prediction_cache
+
     st.title("Check Your Condition")
 
+    if st.checkbox("Live preview", help="Update the prediction while you move the sliders"):
+        live_preview()
+        return
+
     with st.form("obesity_form"):
-        age = st.slider("Age", min_value=1, max_value=120)
-        gender = st.selectbox("Gender", ["Male", "Female"])
-        height = st.slider("Height (in meters)", min_value=0.5, max_value=2.5, step=0.01)
-        weight = st.slider("Weight (in kg)", min_value=20, max_value=200)
-
-        calc = st.selectbox("How often do you drink alcohol?", ["Never", "Sometimes", "Frequently", "Always"])
-        favc = st.selectbox("Do you eat high caloric food frequently?", ["No", "Yes"])
-        fcvc = st.slider("Do you usually eat vegetables in your meals?", min_value=0, max_value=10)
-        ncp = st.slider("How many main meals do you have daily?", min_value=0, max_value=10)
-        scc = st.selectbox("Do you monitor the calories you eat daily?", ["No", "Yes"])
-        smoke = st.selectbox("Do you smoke?", ["No", "Yes"])
-        ch20 = st.slider("How much water do you drink daily? (in liters)", min_value=0.0, max_value=10.0, step=0.1)
-        fhwo = st.selectbox("Family History With Overweight", ["No", "Yes"])
-        faf = st.slider("How often do you have physical activity? (days per week)", min_value=0, max_value=7)
-        tue = st.slider("How much time do you use technological devices daily? (in hours)", min_value=0, max_value=24)
-        caec = st.selectbox("Do you eat any food between meals?", ["No", "Sometimes", "Frequently", "Always"])
-        mtrans = st.selectbox("Which transportation do you usually use?", ["Automobile", "Motorbike", "Bike", "Public Transportation", "Walking"])
+        values = obesity_inputs()
+        age, height, weight = values["age"], values["height"], values["weight"]
 
         submit_button = st.form_submit_button(label="Check Status")
 
         if submit_button:
             if all([age, height, weight]):
-                gender_value = 1 if gender == "Male" else 0
-                calc_value = {"Never": 0, "Sometimes": 1, "Frequently": 2, "Always": 3}[calc]
-                favc_value = 1 if favc == "Yes" else 0
-                scc_value = 1 if scc == "Yes" else 0
-                smoke_value = 1 if smoke == "Yes" else 0
-                fhwo_value = 1 if fhwo == "Yes" else 0
-                caec_value = {"No": 0, "Sometimes": 1, "Frequently": 2, "Always": 3}[caec]
-                mtrans_value = {"Automobile": 0, "Motorbike": 1, "Bike": 2, "Public Transportation": 3, "Walking": 4}[mtrans]
-
-                # Load model and predict
-                obesity_classifier = load_model()
-                prediction = obesity_classifier.predict([[age, gender_value, height, weight, calc_value, favc_value, fcvc, ncp, scc_value, smoke_value, ch20, fhwo_value, faf, tue, caec_value, mtrans_value]])[0]
+                try:
+                    row = features.encoder.encode(values)
+                except ValueError as exc:
+                    st.error(f"Invalid input: {exc}")
+                    return
+
+                st.session_state['last_features'] = values
+
+                # Predict lewat cache, lalu server inferensi yang menggabungkan request antar sesi
+                predict_start = time.perf_counter()
+                prediction, _ = prediction_cache.predict(row)
+                predict_seconds = time.perf_counter() - predict_start
                 
                 st.write(f"Your BMI is: {weight / ((height) ** 2):.2f}")
                 # Display predicted health status
-                health_status = ""
-                if int(prediction) == 0:
-                    health_status = "Insufficient Weight"
-                elif int(prediction) == 1:
-                    health_status = "Normal Weight"
-                elif int(prediction) == 2:
-                    health_status = "Overweight Level 1"
-                elif int(prediction) == 3:
-                    health_status = "Overweight Level 2"
-                elif int(prediction) == 4:
-                    health_status = "Obesity Level 1"
-                elif int(prediction) == 5:
-                    health_status = "Obesity Level 2"
-                elif int(prediction) == 6:
-                    health_status = "Obesity Level 3"
+                health_status = features.HEALTH_STATUSES[int(prediction)]
 
                 st.write(f"Predicted health status: {health_status}")
+                model = model_registry.model_info()
+                serving = inference_server.stats()
+                cached = prediction_cache.stats()
+                st.caption(f"Model version {model['version']} (loaded in {model['load_seconds'] * 1000:.0f} ms) · "
+                           f"inference p50 {serving['p50_ms']:.1f} ms, p99 {serving['p99_ms']:.1f} ms · "
+                           f"cache hit rate {cached['hit_rate']:.0%} ({cached['hits']} hits, {cached['misses']} misses)")
+
+                # Atribusi fitur, dihitung terpisah dari prediksi dan dibatasi anggaran latensi
+                explain_start = time.perf_counter()
+                try:
+                    shap = explain.shap_values(row)
+                    unavailable = None
+                except explain.ExplainUnavailable as exc:
+                    shap, unavailable = None, exc
+                explain_seconds = time.perf_counter() - explain_start
+                if unavailable is not None:
+                    st.caption(f"Feature contributions could not be computed for the current model ({unavailable}).")
+                elif shap is None:
+                    st.caption("Feature contributions are not available right now (over the time budget).")
+                else:
+                    top = explain.contributions(shap, prediction)[:8]
+                    fig = px.bar(x=[value for _, value in top], y=[name for name, _ in top], orientation='h',
+                                 labels={"x": f"Contribution to {health_status}", "y": "Feature"},
+                                 title='Why this result?', template='plotly_dark')
+                    fig.update_layout(yaxis={'autorange': 'reversed'}, plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)')
+                    st.plotly_chart(fig, use_container_width=True)
+                st.caption(f"Prediction {predict_seconds * 1000:.1f} ms · attributions {explain_seconds * 1000:.1f} ms")
 
                 # Get recommendations
                 workout = ""
@@ -492,13 +595,29 @@ def obesity_classification_page():
             else:
                 st.error("Please fill in all the details")
 
+    if 'last_features' in st.session_state:
+        whatif_panel()
+
+# Navigasi halaman artikel (keyset): hanya artikel di halaman yang sedang tampil yang diambil
+# beserta gambarnya. Cursor tiap halaman disimpan di session_state supaya bisa kembali.
+def article_pager(key, limit=None):
+    cursors = st.session_state.setdefault(f"{key}_cursors", [0])
+    articles, next_after = article_store.page(cursors[-1], limit)
+    if not articles and len(cursors) > 1:
+        # Halaman kosong (misalnya artikel terakhirnya dihapus), mundur satu halaman
+        cursors.pop()
+        articles, next_after = article_store.page(cursors[-1], limit)
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+    col1.button("Previous page", key=f"{key}_prev", disabled=len(cursors) == 1, on_click=cursors.pop)
+    col2.caption(f"Page {len(cursors)}")
+    col3.button("Next page", key=f"{key}_next", disabled=next_after is None, on_click=cursors.append, args=(next_after,))
+    return articles
+
 # Fungsi untuk menampilkan artikel
+@fragment
 def display_articles():
-    conn = create_connection()
-    c = conn.cursor()
-    c.execute("SELECT * FROM articles")
-    articles = c.fetchall()
-    conn.close()
+    articles = article_pager("articles")
 
 # Menampilkan artikel dalam grid
     cols_per_row = 2
@@ -513,11 +632,12 @@ def display_articles():
                 article = articles[article_index]
                 with cols[col_num]:
                     st.markdown(f"### {article[1]}")
-                    st.image(article[3], use_column_width=True)
+                    st.image(thumbnails.image(article[3]), **IMAGE_STRETCH)
                     st.write(article[2])
                     st.markdown(f"[Read more]({article[4]})")
 
 # Halaman admin untuk menambahkan dan menghapus artikel
+@page("Admin Page")
 def admin_page():
     st.title("Admin Page")
     st.write("Manage articles")
@@ -531,42 +651,157 @@ def admin_page():
 
         if submit_button:
             if title and description and image_url and url:
-                conn = create_connection()
-                c = conn.cursor()
-                c.execute("INSERT INTO articles (title, description, image_url, url) VALUES (?, ?, ?, ?)", (title, description, image_url, url))
-                conn.commit()
-                conn.close()
+                article_store.add(title, description, image_url, url)
                 st.success("Article added successfully")
             else:
                 st.error("All fields are required")
 
-    st.write("### Existing Articles")
+    bulk_articles_section()
 
-    conn = create_connection()
-    c = conn.cursor()
-    c.execute("SELECT * FROM articles")
-    articles = c.fetchall()
-    conn.close()
+    st.write("### Existing Articles")
 
-    for article in articles:
-        st.markdown(f"#### {article[1]}")
-        st.image(article[3], use_column_width=True)
-        st.write(article[2])
-        st.markdown(f"[Read more]({article[4]})")
-        if st.button(f"Delete {article[1]}", key=article[0]):
-            delete_article(article[0])
-            st.success(f"Article '{article[1]}' deleted successfully")
-            st.experimental_rerun()
-
-# Fungsi untuk menghapus artikel dari database
-def delete_article(article_id):
-    conn = create_connection()
-    c = conn.cursor()
-    c.execute("DELETE FROM articles WHERE id = ?", (article_id,))
-    conn.commit()
-    conn.close()
+    # Halaman tabel admin jauh lebih besar dari halaman pembaca, jadi ratusan artikel bisa dibersihkan
+    # dalam satu atau dua kali terapkan
+    articles = article_pager("admin_articles", settings.ADMIN_ARTICLES_PAGE_SIZE)
+
+    # Pilih beberapa artikel untuk dihapus/diubah lalu terapkan sekaligus dalam satu transaksi
+    select_all = st.checkbox(f"Mark all {len(articles)} articles on this page for deletion", key="admin_select_all")
+    original = {article[0]: article[1:] for article in articles}
+    edited = st.data_editor(
+        [{"delete": select_all, "id": article[0], "title": article[1], "description": article[2],
+          "image_url": article[3], "url": article[4]} for article in articles],
+        column_config={"delete": st.column_config.CheckboxColumn("Delete"), "url": st.column_config.LinkColumn("URL")},
+        disabled=["id"], hide_index=True, use_container_width=True,
+        key=f"admin_articles_editor_{st.session_state['admin_articles_cursors'][-1]}_{select_all}",
+    )
+    if st.button("Apply changes"):
+        delete_ids = [row["id"] for row in edited if row["delete"]]
+        updates = [(row["id"], row["title"], row["description"], row["image_url"], row["url"]) for row in edited
+                   if not row["delete"] and (row["title"], row["description"], row["image_url"], row["url"]) != original[row["id"]]]
+        if any(not all(values[1:]) for values in updates):
+            st.error("All fields are required")
+        elif delete_ids or updates:
+            deleted, updated = article_store.apply_changes(delete_ids, updates)
+            st.session_state['admin_flash'] = f"Deleted {deleted} and updated {updated} articles"
+            st.session_state.pop('admin_select_all', None)
+            rerun()
+    if 'admin_flash' in st.session_state:
+        st.success(st.session_state.pop('admin_flash'))
+
+    landing_articles_section()
+
+    bulk_users_section()
+
+    user_roles_section()
+
+    login_service_section()
+
+    run_times_section()
+
+# Ubah role pengguna; semua sesi pengguna itu langsung dibatalkan
+def user_roles_section():
+    st.write("### User Roles")
+    with st.form("user_role_form"):
+        email = st.text_input("User email").strip()
+        role = st.selectbox("New role", ["user", "admin"])
+        if st.form_submit_button("Change role"):
+            if auth.set_role(email, role):
+                st.success(f"{email} is now {role}; their open sessions were signed out")
+            else:
+                st.error("No user with that email")
+
+# Antrean layanan hash/verifikasi password (pool proses KDF)
+def login_service_section():
+    import credential_service
+
+    st.write("### Login Service")
+    kdf = credential_service.stats()
+    st.caption(f"Password hashing: {kdf['workers']} workers · queue depth {kdf['queue_depth']} "
+               f"(max {kdf['max_queue_depth']}) · {kdf['rejected']} rejected as busy · "
+               f"p50 {kdf['p50_ms']:.0f} ms, p99 {kdf['p99_ms']:.0f} ms · {kdf['bulk_hashed']} hashed by bulk imports")
+    limits = throttle.stats()
+    st.caption(f"Login throttling: {limits['client']['rejected']} attempts rejected per client, "
+               f"{limits['email']['rejected']} per email · {limits['client']['keys']} clients and "
+               f"{limits['email']['keys']} emails tracked")
+    active = sessions.stats()
+    st.caption(f"Sessions: {active['sessions']} active · cache {active['cached']} entries, {active['hits']} hits, "
+               f"{active['misses']} database lookups · {active['rejected']} tokens rejected")
+
+# Waktu run skrip per interaksi: rerun penuh ("script") dibandingkan run fragment per halaman
+def run_times_section():
+    st.write("### Script Run Times")
+    st.table([{"run": name, "count": stats["count"], "p50 ms": round(stats["p50_ms"], 1),
+               "p99 ms": round(stats["p99_ms"], 1)} for name, stats in metrics.snapshot().items()])
+
+# Atur artikel rekomendasi di halaman landing (flag featured dan urutan)
+def landing_articles_section():
+    st.write("### Landing Page Articles")
+    current = article_store.featured()
+    edited = st.data_editor(
+        [{"remove": False, "id": article_id, "title": title, "position": position} for article_id, title, position in current],
+        column_config={"remove": st.column_config.CheckboxColumn("Remove"),
+                       "position": st.column_config.NumberColumn("Position", min_value=0, step=1)},
+        disabled=["id", "title"], hide_index=True, use_container_width=True, key="landing_articles_editor",
+    )
+    add_id = st.number_input("Feature article by ID", min_value=0, step=1, value=0, key="landing_add_id")
+    if st.button("Update landing page"):
+        positions = {article_id: position for article_id, _, position in current}
+        changes = [(row["id"], None if row["remove"] else int(row["position"] or 0)) for row in edited
+                   if row["remove"] or row["position"] != positions[row["id"]]]
+        if add_id:
+            changes.append((int(add_id), max(positions.values(), default=0) + 1))
+        if changes:
+            try:
+                article_store.set_featured(changes)
+            except ValueError as exc:
+                st.error(str(exc))
+            else:
+                rerun()
+    asset_stats = assets.stats()
+    st.caption(f"Page assets: {asset_stats['cached']} cached · fetch p50 {asset_stats['p50_ms']:.0f} ms, "
+               f"p99 {asset_stats['p99_ms']:.0f} ms · {asset_stats['not_modified']} revalidated, "
+               f"{asset_stats['failures']} failed")
+
+# Import artikel massal dari CSV/JSON, ditulis per chunk dalam satu transaksi
+def bulk_articles_section():
+    uploaded = st.file_uploader("Import articles from CSV or JSON (title, description, image_url, url)",
+                                type=["csv", "json"], key="bulk_articles_upload")
+    if uploaded is not None and st.button("Import articles"):
+        try:
+            added, invalid = article_store.import_articles(article_store.read_articles(uploaded, uploaded.name))
+        except (ValueError, UnicodeDecodeError) as exc:
+            st.error(f"Could not read {uploaded.name}: {exc}")
+        else:
+            st.success(f"Imported {added} articles")
+            if invalid:
+                st.warning(f"Skipped {len(invalid)} incomplete records: {', '.join(map(str, invalid[:20]))}")
+
+# Import/ekspor pengguna massal dari halaman admin
+def bulk_users_section():
+    import bulk_users
+    import credential_service
+
+    st.write("### Bulk Users")
+    uploaded = st.file_uploader("Import users from CSV (email, password)", type=["csv"], key="bulk_users_upload")
+    if uploaded is not None and st.button("Import users"):
+        report = io.StringIO()
+        try:
+            with st.spinner("Importing users..."):
+                counts = bulk_users.import_users(io.TextIOWrapper(uploaded, encoding="utf-8-sig", newline=""), report)
+        except (ValueError, credential_service.ServiceBusy) as exc:
+            st.error(str(exc))
+        else:
+            st.success(f"Created {counts['created']} users, {counts['exists']} already existed, "
+                       f"{counts['invalid']} invalid, {counts['duplicate']} duplicates ({counts['seconds']:.1f} s)")
+            st.download_button("Download import report", report.getvalue(), file_name="import_report.csv", mime="text/csv")
+
+    if st.button("Prepare user export"):
+        export = io.StringIO()
+        total = bulk_users.export_users(export)
+        st.download_button(f"Download {total} users", export.getvalue(), file_name="users.csv", mime="text/csv")
 
 # Halaman bantuan
+@page("Help")
 def help_page():
     st.title("Help")
     st.write("This is the help page. How can we assist you?")
@@ -583,6 +818,7 @@ def help_page():
             st.write(answer)
 
 # Halaman landing
+@page("landing")
 def landing_page():
     st.markdown("""
     <div class="title-box">
@@ -595,8 +831,9 @@ def landing_page():
 
 
     # Animasi Lottie
-    lottie_animation = load_lottie_url("https://lottie.host/2f5893df-cc66-48be-be2d-9092bd6a9877/xKC7RTy8kE.json")
+    lottie_animation = assets.lottie("landing_lottie")
     if lottie_animation:
+        from streamlit_lottie import st_lottie
         st_lottie(lottie_animation, height=300, key="landing")
 
     # Membuat container untuk tombol-tombol
@@ -608,11 +845,11 @@ def landing_page():
         with col2_2:
             if st.button("Sign Up"):
                 st.session_state['page'] = 'signup'
-                st.experimental_rerun()
+                rerun()
         with col3:
             if st.button("Sign In"):
                 st.session_state['page'] = 'login'
-                st.experimental_rerun()
+                rerun()
 
  # Menampilkan artikel dalam kolom
     display_articleslp()
@@ -625,44 +862,7 @@ def landing_page():
 
 # Menampilkan artikel dalam kolom
 def display_articleslp():
-    articles = [
-        {
-            "title": "Pentingnya Aktif Bergerak untuk Jaga Berharganya Kesehatan Tubuh.",
-            "description": "Tahukah kamu bahwa aktif bergerak tidak hanya baik untuk kesehatan tubuh tapi juga bagi kesehatan mental serta menjaga penampilan tetap prima?.",
-            "image_url": "https://www.anlene.com/content/dam/countries/indonesia/anlene_indonesia/article/1280-08.-anlene_followup_february2021_pentingnya-aktif-bergerak-untuk-jaga-berharganya-kesehatan-tubuh-rev.jpg",
-            "url": "https://www.anlene.com/id/ms/pentingnya-aktif-bergerak.html"
-        },
-        {
-            "title": "8 Macam Buah yang Ampuh Turunkan Kolesterol",
-            "description": "Tubuh memproduksi kolesterol bukan tanpa alasan. Dalam proses pencernaan lemak makanan dan produksi sejumlah hormon seperti testosteron",
-            "image_url": "https://www.anlene.com/content/dam/anlene/AnleneIDnew/buah_turunkan_kolesterol.jpg",
-            "url": "https://www.anlene.com/id/ms/buah-penurun-kolesterol.html"
-        },
-        {
-            "title": "T4 Macam Penyakit Tulang Rapuh yang Harus Diwaspadai",
-            "description": "Ketika mendengar kata penyakit tulang rapuh, kebanyakan dari kita pasti otomatis berpikir osteoporosis. Faktanya, osteoporosis bukanlah satu-satunya",
-            "image_url": "https://www.anlene.com/content/dam/anlene/AnleneIDnew/01.%20Anlene_FollowUp_Oktober2021_4%20Macam%20Penyakit%20Tulang%20Rapuh%20yang%20Harus%20Diwaspadai%20.jpg",
-            "url": "https://www.anlene.com/id/ms/penyakit-tulang-rapuh.html"
-        },
-        {
-            "title": "Dukung Orang Tua Jadi Lansia Prima, Ini 7 Rekomendasi Olahraga untuk Lansia!",
-            "description": "Baik anak-anak, remaja, orang dewasa hingga orang tua, semua memiliki kebutuhan yang sama akan olahraga.",
-            "image_url": "https://www.anlene.com/content/dam/countries/indonesia/anlene_indonesia/article_2/1280-09.-anlene_followup_mei2021_dukung-orang-tua-jadi-lansia-prima,-ini-7-rekomendasi-olahraga-untuk-lansia!.jpg",
-            "url": "https://www.anlene.com/id/ms/olahraga-untuk-lansia.html"
-        },
-        {
-            "title": "Jangan Disepelekan! Ginjal Punya Fungsi Penting untuk Tubuh",
-            "description": "Ginjal adalah organ tubuh yang terletak di bawah tulang rusuk bagian belakang, dekat bagian tengah punggung pada kedua sisi tulang belakang. ",
-            "image_url": "https://www.anlene.com/content/dam/anlene/AnleneIDnew/05.%20Anlene_FollowUp_March2022_Jangan%20Disepelekan!%20Ginjal%20Punya%20Fungsi%20Penting%20untuk%20Tubuh.jpg",
-            "url": "https://www.anlene.com/id/ms/pentingnya-ginjal-untuk-tubuh.html"
-        },
-        {
-            "title": "Pentingnya Aktif Bergerak untuk Jaga Berharganya Kesehatan Tubuh",
-            "description": "Tahukah kamu bahwa aktif bergerak tidak hanya baik untuk kesehatan tubuh tapi juga bagi kesehatan mental serta menjaga penampilan tetap prima? ",
-            "image_url": "https://www.anlene.com/content/dam/countries/indonesia/anlene_indonesia/article/1280-08.-anlene_followup_february2021_pentingnya-aktif-bergerak-untuk-jaga-berharganya-kesehatan-tubuh-rev.jpg",
-            "url": "https://www.anlene.com/id/ms/pentingnya-aktif-bergerak-untuk-jaga-berharganya-kesehatan-tubuh.html"
-        }
-    ]
+    articles = article_store.landing()
 
     st.markdown("## Rekomendasi Artikel")
 
@@ -672,14 +872,33 @@ def display_articleslp():
             if i + j < len(articles):
                 article = articles[i + j]
                 with cols[j]:
-                    st.image(article["image_url"], use_column_width=True)
-                    st.markdown(f"### {article['title']}")
-                    st.write(f"{article['description']} [Read more]({article['url']})")
+                    st.image(thumbnails.image(article.image_url), **IMAGE_STRETCH)
+                    st.markdown(f"### {article.title}")
+                    st.write(f"{article.description} [Read more]({article.url})")
 
 
 # Fungsi utama untuk mengatur halaman-halaman
-def main():
+# Halaman untuk pengguna yang sudah login: judul menu -> (ikon, fungsi halaman)
+USER_PAGES = {
+    "Home": ("house", main_page),
+    "Articles": ("book", articles_page),
+    "Workout Video": ("calculator", video_page),
+    "Check Your Condition": ("check-circle", obesity_classification_page),
+    "Help": ("question-circle", help_page),
+}
+ADMIN_PAGES = {"Admin Page": ("gear", admin_page)}
+GUEST_PAGES = {"landing": landing_page, "login": login, "signup": signup}
+
+
+def route():
     load_css()
+
+    # Skema database dimigrasi saat deploy (python migrations.py); di sini cukup cek versinya
+    try:
+        migrations.check()
+    except RuntimeError as exc:
+        st.error(str(exc))
+        st.stop()
     
     if 'logged_in' not in st.session_state:
         st.session_state['logged_in'] = False
@@ -687,42 +906,41 @@ def main():
         st.session_state['page'] = 'landing'
     if 'role' not in st.session_state:
         st.session_state['role'] = None
+    if not st.session_state['logged_in']:
+        restore_session()
+    else:
+        check_session()
+    write_session_cookie()
 
     if st.session_state['logged_in']:
+        from streamlit_option_menu import option_menu
+        pages = dict(USER_PAGES, **(ADMIN_PAGES if st.session_state['role'] == 'admin' else {}))
         with st.sidebar:
             selected = option_menu(
                 menu_title="Menu",
-                options=["Home", "Articles", "Workout Video", "Check Your Condition", "Help", "Admin Page", "Logout"]
-                if st.session_state['role'] == 'admin'
-                else ["Home", "Articles", "Workout Video", "Check Your Condition", "Help", "Logout"],
-                icons=["house", "book", "calculator", "check-circle", "question-circle",  "door-open"],
+                options=list(pages) + ["Logout"],
+                icons=[icon for icon, _ in pages.values()] + ["door-open"],
                 menu_icon="cast",
                 default_index=0,
             )
 
-        if selected == "Home":
-            main_page()
-        elif selected == "Articles":
-            articles_page()
-        elif selected == "Workout Video":
-            video_page()
-        elif selected == "Check Your Condition":
-            obesity_classification_page()
-        elif selected == "Help":
-            help_page()
-        elif selected == "Admin Page":
-            admin_page()
-        elif selected == "Logout":
-            st.session_state['logged_in'] = False
+        if selected == "Logout":
+            end_session()
             st.session_state['page'] = 'landing'
-            st.experimental_rerun()
+            rerun()
+        pages[selected][1]()
     else:
-        if st.session_state['page'] == 'landing':
-            landing_page()
-        elif st.session_state['page'] == 'login':
-            login()
-        elif st.session_state['page'] == 'signup':
-            signup()
+        GUEST_PAGES[st.session_state['page']]()
+
+    # Panaskan model setelah halaman pertama selesai dirender, supaya impor CatBoost dan unpickle
+    # tidak berebut CPU dengan render pertama tapi sudah siap sebelum form klasifikasi disubmit
+    model_registry.warm()
+
+
+# Fungsi utama: satu rerun penuh dari atas, diukur waktunya
+def main():
+    with metrics.timer("script").time():
+        route()
 
 if __name__ == "__main__":
     main()
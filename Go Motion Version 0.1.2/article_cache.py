@@ -0,0 +1,81 @@
+import threading
+import time
+
+import db
+import settings
+
+# Cache baca per proses untuk data artikel, dikunci ke penghitung versi di tabel content_version.
+# Trigger menaikkan versi dalam transaksi yang sama dengan penulisan, jadi proses lain melihat
+# perubahan paling lambat setelah satu interval cek. Di antara cek, pembaca mendapat snapshot
+# immutable (tuple) tanpa menyentuh SQLite. Penulisan di proses ini memaksa cek berikutnya langsung.
+
+
+class VersionedCache:
+    def __init__(self, name, check_interval=None, max_entries=None):
+        self.name = name
+        self.check_interval = settings.ARTICLE_CACHE_CHECK_SECONDS if check_interval is None else check_interval
+        self.max_entries = max_entries or settings.ARTICLE_CACHE_MAX_ENTRIES
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._version = None
+        self._next_check = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.version_checks = 0
+
+    def version(self):
+        now = time.monotonic()
+        if now >= self._next_check:
+            row = db.query_one("SELECT version FROM content_version WHERE name = ?", (self.name,))
+            self.version_checks += 1
+            with self._lock:
+                version = row[0] if row else None
+                if version != self._version:
+                    self._entries = {}
+                    self._version = version
+                self._next_check = now + self.check_interval
+        return self._version
+
+    # Nilai untuk key dari snapshot versi sekarang; loader hanya dipanggil saat miss
+    def get(self, key, loader):
+        version = self.version()
+        entries = self._entries
+        if key in entries:
+            self.hits += 1
+            return entries[key]
+        self.misses += 1
+        value = _freeze(loader())
+        with self._lock:
+            if self._version == version:
+                if len(self._entries) >= self.max_entries:
+                    self._entries = {}
+                # Copy-on-write: pembaca tanpa lock selalu melihat dict yang utuh
+                self._entries = {**self._entries, key: value}
+        return value
+
+    def invalidate(self):
+        with self._lock:
+            self._next_check = 0.0
+
+    def stats(self):
+        return {"version": self._version, "entries": len(self._entries), "hits": self.hits, "misses": self.misses,
+                "version_checks": self.version_checks}
+
+
+def _freeze(value):
+    if hasattr(value, "_fields"):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+articles = VersionedCache("articles")
+# Payload halaman landing jarang berubah; proses lain cukup mengecek versinya sesekali
+landing = VersionedCache("articles", check_interval=settings.LANDING_CACHE_CHECK_SECONDS)
+
+
+# Dipanggil setelah setiap penulisan artikel di proses ini
+def invalidate():
+    articles.invalidate()
+    landing.invalidate()
@@ -0,0 +1,217 @@
+import csv
+import io
+import json
+import re
+import time
+from collections import namedtuple
+
+import article_cache
+import db
+import settings
+import thumbnails
+
+# Akses data artikel. Daftar artikel dibaca per halaman dengan keyset pagination
+# (WHERE id > ? ORDER BY id LIMIT ?) lewat index primary key, jadi biaya per halaman
+# tetap walaupun katalog bertambah.
+COLUMNS = "id, title, description, image_url, url"
+
+
+# Mengembalikan (baris, id terakhir untuk halaman berikutnya atau None kalau sudah habis).
+# Hasil di-cache per versi konten, jadi halaman yang sama tidak query ulang ke SQLite.
+def page(after_id=0, limit=None):
+    limit = limit or settings.ARTICLES_PAGE_SIZE
+    return article_cache.articles.get(("page", after_id, limit), lambda: _page_query(after_id, limit))
+
+
+def _page_query(after_id, limit):
+    rows = db.query_all(f"SELECT {COLUMNS} FROM articles WHERE id > ? ORDER BY id LIMIT ?", (after_id, limit + 1))
+    if len(rows) > limit:
+        return rows[:limit], rows[limit - 1][0]
+    return rows, None
+
+
+def add(title, description, image_url, url):
+    article_id = db.execute("INSERT INTO articles (title, description, image_url, url) VALUES (?, ?, ?, ?)",
+                            (title, description, image_url, url)).lastrowid
+    article_cache.invalidate()
+    return article_id
+
+
+def delete(article_id):
+    db.execute("DELETE FROM articles WHERE id = ?", (article_id,))
+    article_cache.invalidate()
+
+
+# Kartu rekomendasi siap tampil untuk halaman landing
+Card = namedtuple("Card", ["title", "description", "image_url", "url"])
+
+
+# Kartu artikel featured, urut position. Dibangun sekali per versi konten lalu disajikan dari memori
+# tanpa query ke SQLite sampai ada perubahan artikel. Kartu menyimpan URL gambar, bukan path thumbnail:
+# path di-resolve saat render (thumbnails.image, cukup satu utime untuk hit) supaya file yang sering
+# dipakai tidak tergusur LRU dan gambar yang gagal diunduh dicoba lagi setelah masa backoff-nya.
+def landing(limit=None):
+    limit = limit or settings.LANDING_ARTICLES
+    return article_cache.landing.get(("landing", limit), lambda: _landing_cards(limit))
+
+
+def _landing_cards(limit):
+    rows = db.query_all("SELECT title, description, image_url, url FROM articles WHERE featured = 1 "
+                        "ORDER BY position, id LIMIT ?", (limit,))
+    cards = [Card(title, _trim(description, settings.LANDING_DESCRIPTION_CHARS), image_url, url)
+             for title, description, image_url, url in rows]
+    # Siapkan thumbnail di latar belakang; selama belum siap, kartu memakai URL aslinya
+    thumbnails.prefetch([card.image_url for card in cards])
+    return cards
+
+
+def _trim(text, limit):
+    text = text.strip()
+    if len(text) <= limit:
+        return text
+    return text[:limit].rsplit(" ", 1)[0].rstrip(" ,.;:") + "..."
+
+
+def featured():
+    return db.query_all("SELECT id, title, position FROM articles WHERE featured = 1 ORDER BY position, id")
+
+
+# Atur artikel featured dalam satu transaksi. changes: list (id, position), position None = bukan featured.
+# ID yang tidak ada ditolak dengan ValueError dan tidak ada yang diubah.
+def set_featured(changes):
+    ids = sorted({article_id for article_id, _ in changes})
+    with db.transaction() as conn:
+        placeholders = ",".join("?" * len(ids))
+        existing = {row[0] for row in conn.execute(f"SELECT id FROM articles WHERE id IN ({placeholders})", ids)}
+        unknown = [article_id for article_id in ids if article_id not in existing]
+        if unknown:
+            raise ValueError(f"No article with ID {', '.join(map(str, unknown))}")
+        conn.executemany("UPDATE articles SET featured = ?, position = ? WHERE id = ?",
+                         [(position is not None, position or 0, article_id) for article_id, position in changes])
+    article_cache.invalidate()
+
+
+FIELDS = ("title", "description", "image_url", "url")
+
+
+# Baca artikel dari file biner CSV atau JSON (list objek) dengan kolom title, description, image_url, url
+def read_articles(file, filename):
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    if filename.lower().endswith(".json"):
+        records = json.load(text)
+        if not isinstance(records, list):
+            raise ValueError("JSON must be a list of article objects")
+        return records
+    return list(csv.DictReader(text))
+
+
+def _clean(record):
+    if not isinstance(record, dict):
+        return None
+    values = tuple(str(record.get(field) or "").strip() for field in FIELDS)
+    return values if all(values) else None
+
+
+def _chunks(rows, size):
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+# Tambah banyak artikel sekaligus; baris yang tidak lengkap dilewati dan dilaporkan nomornya
+def import_articles(records, chunk_size=None):
+    chunk_size = chunk_size or settings.BULK_CHUNK_SIZE
+    valid, invalid = [], []
+    for number, record in enumerate(records, start=1):
+        values = _clean(record)
+        if values is None:
+            invalid.append(number)
+        else:
+            valid.append(values)
+    with db.transaction() as conn:
+        for chunk in _chunks(valid, chunk_size):
+            conn.executemany("INSERT INTO articles (title, description, image_url, url) VALUES (?, ?, ?, ?)", chunk)
+    article_cache.invalidate()
+    return len(valid), invalid
+
+
+# Hapus dan ubah banyak artikel dalam satu transaksi. updates: list (id, title, description, image_url, url)
+def apply_changes(delete_ids=(), updates=(), chunk_size=None):
+    chunk_size = chunk_size or settings.BULK_CHUNK_SIZE
+    delete_ids, updates = list(delete_ids), list(updates)
+    with db.transaction() as conn:
+        for chunk in _chunks([(article_id,) for article_id in delete_ids], chunk_size):
+            conn.executemany("DELETE FROM articles WHERE id = ?", chunk)
+        for chunk in _chunks([(*values, article_id) for article_id, *values in updates], chunk_size):
+            conn.executemany("UPDATE articles SET title = ?, description = ?, image_url = ?, url = ? WHERE id = ?", chunk)
+    article_cache.invalidate()
+    return len(delete_ids), len(updates)
+
+
+# Ubah teks bebas dari pengguna menjadi query FTS5 yang aman: setiap kata dicari sebagai prefix
+def fts_query(text):
+    terms = re.findall(r"\w+", text or "")
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+# Hasil pencarian terurut relevansi (bm25), dengan judul yang di-highlight dan cuplikan deskripsi
+def search(text, offset=0, limit=None):
+    limit = limit or settings.ARTICLES_PAGE_SIZE
+    query = fts_query(text)
+    if not query:
+        return [], False
+    rows = db.query_all(
+        """SELECT a.id, a.title, a.description, a.image_url, a.url,
+                  highlight(articles_fts, 0, '**', '**'),
+                  snippet(articles_fts, 1, '**', '**', '...', 24)
+           FROM articles_fts JOIN articles a ON a.id = articles_fts.rowid
+           WHERE articles_fts MATCH ?
+           ORDER BY rank LIMIT ? OFFSET ?""",
+        (query, limit + 1, offset))
+    return rows[:limit], len(rows) > limit
+
+
+# Benchmark pencarian di database sementara berisi 100k artikel sintetis
+def _benchmark_search(size=100000, runs=50):
+    import itertools
+    import os
+    import random
+    import shutil
+    import tempfile
+
+    import migrations
+
+    directory = tempfile.mkdtemp()
+    settings.DB_PATH = os.path.join(directory, "bench.db")
+    try:
+        migrations.apply()
+        # Kosakata 5000 kata dengan frekuensi Zipf, mirip distribusi kata pada teks asli
+        topics = ["olahraga", "kesehatan", "jantung", "diet", "protein", "kolesterol", "ginjal", "tulang"]
+        rng = random.Random(0)
+        words = topics + [f"kata{i}" for i in range(5000 - len(topics))]
+        weights = [1 / (rank + 1) for rank in range(len(words))]
+        rng.shuffle(weights)
+        weights = list(itertools.accumulate(weights))
+        start = time.perf_counter()
+        db.executemany("INSERT INTO articles (title, description, image_url, url) VALUES (?, ?, ?, ?)",
+                       ((" ".join(rng.choices(words, cum_weights=weights, k=6)), " ".join(rng.choices(words, cum_weights=weights, k=40)),
+                         f"https://example.com/{i}.jpg", f"https://example.com/{i}") for i in range(size)))
+        print(f"Inserted {size} articles (with FTS triggers) in {time.perf_counter() - start:.1f} s")
+
+        for text in ("kolesterol", "olahraga jantung", "diet protein tulang", "ginj"):
+            search(text)
+            start = time.perf_counter()
+            for _ in range(runs):
+                search(text)
+            first = (time.perf_counter() - start) / runs
+            start = time.perf_counter()
+            for _ in range(runs // 10):
+                search(text, offset=60)
+            deep = (time.perf_counter() - start) / (runs // 10)
+            print(f"{text!r:>22}: first page {first * 1000:.2f} ms, page 11 {deep * 1000:.2f} ms")
+        db.get_pool().close()
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    _benchmark_search()
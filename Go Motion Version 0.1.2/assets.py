@@ -0,0 +1,203 @@
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+
+import metrics
+import settings
+
+# Aset statis halaman (animasi Lottie, gambar latar). Setiap aset diunduh sekali dengan timeout ke cache
+# disk bersama ETag-nya, lalu disajikan dari memori. Setelah ASSET_REVALIDATE_SECONDS, versi yang ada
+# tetap dipakai sementara thread latar belakang merevalidasi (If-None-Match); kalau CDN lambat atau
+# mati, pengunjung tetap mendapat salinan lama. Unduhan pertama (tanpa salinan disk) juga berjalan di latar
+# belakang: selama belum selesai aset dianggap belum ada, jadi render pertama tidak menunggu CDN (atau impor
+# requests).
+ASSETS = {
+    "landing_lottie": "https://lottie.host/2f5893df-cc66-48be-be2d-9092bd6a9877/xKC7RTy8kE.json",
+    "background": "https://r4.wallpaperflare.com/wallpaper/707/220/899/gradient-blue-pink-abstract-art-wallpaper-a33b436d2de9cbc5dfa6225748ab3818.jpg",
+}
+
+fetch_latency = metrics.LatencyStats()
+
+
+# Klien HTTP: (url, etag, timeout) -> (status, body, etag). Status 304 berarti salinan lokal masih berlaku.
+def requests_fetch(url, etag, timeout):
+    import requests
+    response = requests.get(url, headers={"If-None-Match": etag} if etag else {}, timeout=timeout)
+    if response.status_code == 304:
+        return 304, None, etag
+    response.raise_for_status()
+    return response.status_code, response.content, response.headers.get("ETag")
+
+
+class AssetCache:
+    def __init__(self, assets=None, directory=None, fetch=None, timeout=None, revalidate_seconds=None):
+        self.assets = assets or ASSETS
+        self.directory = directory or settings.ASSET_DIR
+        self.fetch = fetch or requests_fetch
+        self.timeout = timeout or settings.ASSET_FETCH_TIMEOUT
+        self.revalidate_seconds = settings.ASSET_REVALIDATE_SECONDS if revalidate_seconds is None else revalidate_seconds
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._derived = {}
+        self._refreshing = set()
+        self._failed_at = {}
+        self.fetches = 0
+        self.not_modified = 0
+        self.failures = 0
+
+    def _paths(self, name):
+        base = os.path.join(self.directory, name)
+        return base, base + ".meta.json"
+
+    # Isi aset (bytes) atau None kalau belum pernah berhasil diunduh
+    def get(self, name):
+        entry = self._entries.get(name)
+        if entry is None:
+            # Setelah unduhan pertama gagal, jangan blok setiap rerun dengan mencoba lagi
+            if time.time() - self._failed_at.get(name, 0) < settings.ASSET_RETRY_SECONDS:
+                return None
+            entry = self._load_disk(name)
+            if entry is None:
+                self._refresh_in_background(name, None)
+                return None
+        elif time.time() - entry["checked_at"] >= self.revalidate_seconds:
+            self._refresh_in_background(name, entry)
+        return entry["data"] if entry else None
+
+    # Nilai turunan dari isi aset (JSON ter-parse, CSS data URI), dihitung ulang hanya saat isinya berubah
+    def derived(self, name, transform):
+        data = self.get(name)
+        if data is None:
+            return None
+        key = (name, transform)
+        cached = self._derived.get(key)
+        if cached is None or cached[0] is not data:
+            try:
+                value = transform(data)
+            except Exception:
+                value = None
+            cached = (data, value)
+            self._derived[key] = cached
+        return cached[1]
+
+    def _load_disk(self, name):
+        path, meta_path = self._paths(name)
+        try:
+            with open(meta_path, encoding="utf-8") as file:
+                meta = json.load(file)
+            with open(path, "rb") as file:
+                data = file.read()
+        except (OSError, ValueError):
+            return None
+        entry = {"data": data, "etag": meta.get("etag"), "checked_at": meta.get("checked_at", 0)}
+        self._entries[name] = entry
+        return entry
+
+    # Unduh (atau revalidasi) aset; kalau gagal, entri lama tetap dipakai
+    def _download(self, name, entry):
+        start = time.perf_counter()
+        try:
+            status, data, etag = self.fetch(self.assets[name], entry and entry["etag"], self.timeout)
+        except Exception:
+            self.failures += 1
+            if entry is None:
+                self._failed_at[name] = time.time()
+            else:
+                entry["checked_at"] = time.time()
+            return entry
+        finally:
+            fetch_latency.record(time.perf_counter() - start)
+        self.fetches += 1
+        if status == 304:
+            self.not_modified += 1
+            data = entry["data"]
+        entry = {"data": data, "etag": etag, "checked_at": time.time()}
+        self._store(name, entry, write_data=status != 304)
+        self._entries[name] = entry
+        return entry
+
+    def _refresh_in_background(self, name, entry):
+        with self._lock:
+            if name in self._refreshing:
+                return
+            self._refreshing.add(name)
+
+        def refresh():
+            try:
+                self._download(name, entry)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(name)
+
+        threading.Thread(target=refresh, name=f"asset-refresh-{name}", daemon=True).start()
+
+    def _store(self, name, entry, write_data=True):
+        path, meta_path = self._paths(name)
+        os.makedirs(self.directory, exist_ok=True)
+        if write_data:
+            self._write(path, entry["data"])
+        self._write(meta_path, json.dumps({"url": self.assets[name], "etag": entry["etag"],
+                                           "checked_at": entry["checked_at"]}).encode())
+
+    def _write(self, path, data):
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(tmp, path)
+
+    def stats(self):
+        stats = fetch_latency.snapshot()
+        stats.update({"cached": len(self._entries), "fetches": self.fetches, "not_modified": self.not_modified,
+                      "failures": self.failures})
+        return stats
+
+
+cache = AssetCache()
+
+
+def _parse_json(data):
+    return json.loads(data)
+
+
+# Gambar latar diperkecil lalu ditulis ke folder static Streamlit dengan nama berbasis hash isi, jadi
+# browser bisa meng-cache-nya (URL berubah kalau gambarnya berubah). Versi lama dihapus.
+def _publish_background(data):
+    from PIL import Image
+    with Image.open(io.BytesIO(data)) as image:
+        image = image.convert("RGB")
+        if image.width > settings.ASSET_BACKGROUND_WIDTH:
+            width = settings.ASSET_BACKGROUND_WIDTH
+            image = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+        output = io.BytesIO()
+        image.save(output, "JPEG", quality=75, optimize=True)
+    name = f"background-{hashlib.sha256(output.getvalue()).hexdigest()[:12]}.jpg"
+    path = os.path.join(settings.STATIC_DIR, name)
+    if not os.path.exists(path):
+        os.makedirs(settings.STATIC_DIR, exist_ok=True)
+        cache._write(path, output.getvalue())
+    for entry in os.scandir(settings.STATIC_DIR):
+        if entry.name.startswith("background-") and entry.name != name:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+    return name
+
+
+def lottie(name):
+    return cache.derived(name, _parse_json)
+
+
+# URL untuk background-image di CSS: file di static serving Streamlit (app/static/...), atau URL aslinya
+# kalau gambar belum bisa diunduh
+def background_url():
+    name = cache.derived("background", _publish_background)
+    return f"app/static/{name}" if name else ASSETS["background"]
+
+
+def stats():
+    return cache.stats()
@@ -1,76 +1,38 @@
-import sqlite3
-import hashlib
+import db
+import sessions
 
-# Fungsi untuk hash password
+# Fungsi untuk hash password (scrypt bersalt, dijalankan di pool proses credential_service). Layanan
+# diimpor saat pertama dipakai supaya halaman yang hanya membaca data pengguna tidak memuatnya.
 def hash_password(password):
-    return hashlib.sha256(password.encode()).hexdigest()
-
-# Fungsi untuk membuat koneksi ke database
-def create_connection():
-    return sqlite3.connect('users.db')
-
-# Fungsi untuk membuat tabel pengguna jika belum ada
-def create_user_table():
-    conn = create_connection()
-    c = conn.cursor()
-    c.execute('''CREATE TABLE IF NOT EXISTS users
-                 (id INTEGER PRIMARY KEY AUTOINCREMENT,
-                  email TEXT UNIQUE,
-                  password TEXT,
-                  role TEXT)''')
-    conn.commit()
-    conn.close()
-    create_admin_user()  # Panggil untuk membuat akun admin default
+    import credential_service
+    return credential_service.hash_password(password)
 
 # Fungsi untuk membuat pengguna baru
 def create_user(email, password, role='user'):
-    conn = create_connection()
-    c = conn.cursor()
-    c.execute("INSERT INTO users (email, password, role) VALUES (?, ?, ?)", (email, hash_password(password), role))
-    conn.commit()
-    conn.close()
-
-# Fungsi untuk membuat akun admin default
-def create_admin_user():
-    admin_email = "Adminnocounter21021@gmail.com"
-    admin_password = "AdminNihBoss123"
-    if not user_exists(admin_email):
-        conn = create_connection()
-        c = conn.cursor()
-        c.execute("INSERT INTO users (email, password, role) VALUES (?, ?, ?)", (admin_email, hash_password(admin_password), 'admin'))
-        conn.commit()
-        conn.close()
+    db.execute("INSERT INTO users (email, password, role) VALUES (?, ?, ?)", (email, hash_password(password), role))
 
 # Fungsi untuk memeriksa apakah pengguna ada
 def user_exists(email):
-    conn = create_connection()
-    c = conn.cursor()
-    c.execute("SELECT * FROM users WHERE email = ?", (email,))
-    user = c.fetchone()
-    conn.close()
-    return user
+    return db.query_one("SELECT * FROM users WHERE email = ?", (email,))
+
+# Ubah role pengguna lalu batalkan semua sesinya (tabel dan cache sesi proses ini), jadi role baru
+# berlaku saat pengguna login lagi
+def set_role(email, role):
+    if db.execute("UPDATE users SET role = ? WHERE email = ?", (role, email)).rowcount == 0:
+        return False
+    sessions.invalidate_user(email)
+    return True
 
 # Fungsi untuk memeriksa kredensial pengguna
 def check_credentials(email, password, role):
     user = user_exists(email)
-    if user and user[2] == hash_password(password) and user[3] == role:
-        return user
-    return None
-
-# Panggil fungsi ini untuk memastikan tabel pengguna dibuat saat modul diimpor
-create_user_table()
-
-def create_article_table():
-    conn = create_connection()
-    c = conn.cursor()
-    c.execute('''CREATE TABLE IF NOT EXISTS articles (
-                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                 title TEXT NOT NULL,
-                 description TEXT NOT NULL,
-                 image_url TEXT NOT NULL,
-                 url TEXT NOT NULL)''')
-    conn.commit()
-    conn.close()
-
-# Panggil fungsi ini untuk memastikan tabel artikel dibuat saat modul diimpor
-create_article_table()
+    if not user or user[3] != role:
+        return None
+    import credential_service
+    ok, needs_rehash = credential_service.verify_password(password, user[2])
+    if not ok:
+        return None
+    # Hash SHA-256 lama diganti dengan hash scrypt saat login berhasil
+    if needs_rehash:
+        db.execute("UPDATE users SET password = ? WHERE id = ?", (hash_password(password), user[0]))
+    return user
@@ -0,0 +1,151 @@
+import argparse
+import csv
+import sys
+import time
+
+import credential_service
+import db
+import settings
+from validators import is_valid_email, is_valid_password
+
+# Import/ekspor pengguna massal untuk onboarding klinik:
+#   python bulk_users.py import users.csv report.csv   (kolom: email,password[,role])
+#   python bulk_users.py export users_out.csv
+# Import divalidasi dengan aturan yang sama dengan form signup, password di-hash paralel lewat pool
+# credential_service (batas worker, antrean, dan statistik yang sama dengan login), lalu ditulis per
+# chunk dengan executemany dalam satu transaksi per chunk.
+
+REPORT_FIELDS = ["line", "email", "status", "detail"]
+
+
+def _validate(row, seen):
+    email = (row.get("email") or "").strip()
+    password = row.get("password") or ""
+    role = (row.get("role") or "user").strip() or "user"
+    if not email or not password:
+        return "invalid", "Email and Password cannot be empty"
+    if not is_valid_email(email):
+        return "invalid", "Email harus diakhiri dengan @gmail.com"
+    if not is_valid_password(password):
+        return "invalid", "Password harus mengandung huruf besar, huruf kecil, dan angka. Tidak boleh ada simbol."
+    if role != "user":
+        return "invalid", "Only the user role can be imported"
+    if email in seen:
+        return "duplicate", f"Same email as line {seen[email]}"
+    return None, None
+
+
+def _import_chunk(chunk, service, report):
+    emails = [row["email"] for _, row in chunk]
+    placeholders = ",".join("?" * len(emails))
+    existing = {row[0] for row in db.query_all(f"SELECT email FROM users WHERE email IN ({placeholders})", emails)}
+
+    new_rows = [(line, row) for line, row in chunk if row["email"] not in existing]
+    hashes = service.hash_passwords([row["password"] for _, row in new_rows])
+
+    with db.transaction() as conn:
+        before = conn.total_changes
+        conn.executemany("INSERT OR IGNORE INTO users (email, password, role) VALUES (?, ?, 'user')",
+                         [(row["email"], hashed) for (_, row), hashed in zip(new_rows, hashes)])
+        if conn.total_changes - before == len(new_rows):
+            created = {line for line, _ in new_rows}
+        else:
+            # Ada email yang dibuat proses lain di antara cek dan insert; hash bersalt unik jadi bisa dicocokkan
+            stored = dict(conn.execute(f"SELECT email, password FROM users WHERE email IN ({placeholders})", emails))
+            created = {line for (line, row), hashed in zip(new_rows, hashes) if stored.get(row["email"]) == hashed}
+
+    counts = {"created": 0, "exists": 0}
+    for line, row in chunk:
+        status = "created" if line in created else "exists"
+        counts[status] += 1
+        report.writerow({"line": line, "email": row["email"], "status": status,
+                         "detail": "" if status == "created" else "Email already exists"})
+    return counts
+
+
+# service: CredentialService yang dipakai untuk hashing; bawaan adalah layanan bersama proses ini
+def import_users(infile, reportfile, chunk_size=None, service=None):
+    service = service or credential_service.service
+    chunk_size = chunk_size or settings.BULK_CHUNK_SIZE
+    reader = csv.DictReader(infile)
+    if not reader.fieldnames or not {"email", "password"} <= {name.strip().lower() for name in reader.fieldnames}:
+        raise ValueError("CSV needs email and password columns")
+    reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+    report = csv.DictWriter(reportfile, REPORT_FIELDS)
+    report.writeheader()
+
+    counts = {"created": 0, "exists": 0, "invalid": 0, "duplicate": 0}
+    seen = {}
+    chunk = []
+    start = time.perf_counter()
+    for line, row in enumerate(reader, start=2):
+        status, detail = _validate(row, seen)
+        if status:
+            counts[status] += 1
+            report.writerow({"line": line, "email": row.get("email"), "status": status, "detail": detail})
+            continue
+        row["email"] = row["email"].strip()
+        seen[row["email"]] = line
+        chunk.append((line, row))
+        if len(chunk) >= chunk_size:
+            for key, value in _import_chunk(chunk, service, report).items():
+                counts[key] += value
+            chunk = []
+    if chunk:
+        for key, value in _import_chunk(chunk, service, report).items():
+            counts[key] += value
+    counts["seconds"] = time.perf_counter() - start
+    return counts
+
+
+# Ekspor bertahap (fetchmany) supaya memori tetap kecil; hash password tidak ikut kecuali diminta
+def export_users(outfile, include_hashes=False, batch_size=1000):
+    fields = ["id", "email", "role"] + (["password"] if include_hashes else [])
+    writer = csv.writer(outfile)
+    writer.writerow(fields)
+    total = 0
+    with db.connection() as conn:
+        cursor = conn.execute(f"SELECT {', '.join(fields)} FROM users ORDER BY id")
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            writer.writerows(rows)
+            total += len(rows)
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk import or export user accounts.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    importer = commands.add_parser("import")
+    importer.add_argument("input")
+    importer.add_argument("report")
+    importer.add_argument("--chunk-size", type=int, default=None)
+    importer.add_argument("--workers", type=int, default=None)
+    exporter = commands.add_parser("export")
+    exporter.add_argument("output")
+    exporter.add_argument("--include-hashes", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.command == "import":
+        with open(args.input, newline="", encoding="utf-8-sig") as infile, \
+                open(args.report, "w", newline="", encoding="utf-8") as reportfile:
+            service = credential_service.CredentialService(workers=args.workers)
+            try:
+                counts = import_users(infile, reportfile, args.chunk_size, service)
+            except ValueError as exc:
+                parser.exit(1, f"error: {exc}\n")
+            finally:
+                service.shutdown()
+        rate = counts["created"] / counts["seconds"] * 60 if counts["seconds"] else 0.0
+        print(f"created {counts['created']}, already existed {counts['exists']}, invalid {counts['invalid']}, "
+              f"duplicates {counts['duplicate']} in {counts['seconds']:.1f} s ({rate:,.0f} users/min)", file=sys.stderr)
+    else:
+        with open(args.output, "w", newline="", encoding="utf-8") as outfile:
+            total = export_users(outfile, args.include_hashes)
+        print(f"exported {total} users", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
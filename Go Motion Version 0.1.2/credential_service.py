@@ -0,0 +1,152 @@
+import argparse
+import multiprocessing
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import metrics
+import passwords
+import settings
+
+# Layanan hash/verifikasi password. Pekerjaan KDF dijalankan di pool proses terbatas supaya
+# thread script Streamlit tidak ikut terblokir; jumlah request yang antre dibatasi semaphore.
+
+
+class ServiceBusy(Exception):
+    pass
+
+
+# Konteks proses untuk pool KDF. Server Streamlit sudah punya banyak thread (tornado, batching
+# predictor, pool explain, refresh aset); fork dari proses multi-thread bisa deadlock, jadi worker
+# dibuat lewat forkserver (atau spawn di platform tanpa forkserver, misalnya Windows).
+def process_context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+class CredentialService:
+    def __init__(self, workers=None, max_pending=None, queue_timeout=None):
+        self.workers = workers or settings.KDF_WORKERS
+        self.max_pending = max_pending or settings.KDF_MAX_PENDING
+        self.queue_timeout = settings.KDF_QUEUE_TIMEOUT if queue_timeout is None else queue_timeout
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._batch = threading.BoundedSemaphore(1)
+        self._lock = threading.Lock()
+        self._executor = None
+        self.pending = 0
+        self.max_depth = 0
+        self.rejected = 0
+        self.bulk_hashed = 0
+        self.latency = metrics.LatencyStats()
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(self.workers, mp_context=process_context())
+            return self._executor
+
+    def _acquire(self, slots, message):
+        if not slots.acquire(timeout=self.queue_timeout):
+            with self._lock:
+                self.rejected += 1
+            raise ServiceBusy(message)
+
+    def _run(self, func, *args):
+        self._acquire(self._slots, "Too many password checks in progress, please try again")
+        with self._lock:
+            self.pending += 1
+            self.max_depth = max(self.max_depth, self.pending)
+        try:
+            with self.latency.time():
+                return self._pool().submit(func, *args).result()
+        finally:
+            with self._lock:
+                self.pending -= 1
+            self._slots.release()
+
+    # Hash banyak password (import massal) di pool yang sama. Hanya satu batch berjalan sekaligus, batch
+    # itu memakai satu slot antrean, dan paling banyak workers-1 potongan dikirim bersamaan, jadi login
+    # yang datang di tengah import tetap mendapat worker.
+    def hash_passwords(self, items, chunk_size=4):
+        items = list(items)
+        self._acquire(self._batch, "Another bulk import is hashing passwords, please try again")
+        try:
+            self._acquire(self._slots, "Too many password checks in progress, please try again")
+            try:
+                pool = self._pool()
+                hashes, in_flight = [], deque()
+                for start in range(0, len(items), chunk_size):
+                    in_flight.append(pool.submit(passwords.hash_many, items[start:start + chunk_size]))
+                    if len(in_flight) >= max(1, self.workers - 1):
+                        hashes.extend(in_flight.popleft().result())
+                while in_flight:
+                    hashes.extend(in_flight.popleft().result())
+            finally:
+                self._slots.release()
+        finally:
+            self._batch.release()
+        with self._lock:
+            self.bulk_hashed += len(items)
+        return hashes
+
+    def hash_password(self, password):
+        return self._run(passwords.hash_password, password)
+
+    def verify_password(self, password, stored):
+        return self._run(passwords.verify_password, password, stored)
+
+    def stats(self):
+        stats = self.latency.snapshot()
+        stats.update({"queue_depth": self.pending, "max_queue_depth": self.max_depth, "rejected": self.rejected,
+                      "workers": self.workers, "bulk_hashed": self.bulk_hashed})
+        return stats
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+service = CredentialService()
+
+
+def hash_password(password):
+    return service.hash_password(password)
+
+
+def verify_password(password, stored):
+    return service.verify_password(password, stored)
+
+
+def hash_passwords(items):
+    return service.hash_passwords(items)
+
+
+def stats():
+    return service.stats()
+
+
+# Benchmark: N login bersamaan terhadap hash scrypt, throughput dan kedalaman antrean
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark login throughput under concurrent attempts.")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--attempts", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    stored = passwords.hash_password("Password123")
+    verify_password("Password123", stored)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(args.concurrency) as clients:
+        results = list(clients.map(lambda _: verify_password("Password123", stored)[0], range(args.attempts)))
+    elapsed = time.perf_counter() - start
+    result = stats()
+    print(f"{args.attempts} logins with {args.concurrency} concurrent clients on {result['workers']} workers: "
+          f"{args.attempts / elapsed:.1f} logins/s, p50 {result['p50_ms']:.0f} ms, p99 {result['p99_ms']:.0f} ms, "
+          f"max queue depth {result['max_queue_depth']}, all verified: {all(results)}")
+    service.shutdown()
+
+
+if __name__ == "__main__":
+    main()
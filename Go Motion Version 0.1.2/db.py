@@ -0,0 +1,205 @@
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+import settings
+
+# Lapisan akses data SQLite: pool koneksi yang dipakai ulang antar thread/sesi Streamlit,
+# dengan WAL, pragma yang disetel, cache prepared statement, dan retry saat SQLITE_BUSY.
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-8000",
+)
+_RETRIES = 5
+
+
+# Semua koneksi di pool sedang dipakai lebih lama dari DB_POOL_TIMEOUT (pool terlalu kecil atau ada
+# kode yang menahan satu koneksi sambil meminta koneksi kedua)
+class PoolExhausted(RuntimeError):
+    pass
+
+
+class ConnectionPool:
+    def __init__(self, path=None, size=None, timeout=None):
+        self.path = path or settings.DB_PATH
+        self.size = size or settings.DB_POOL_SIZE
+        self.timeout = settings.DB_POOL_TIMEOUT if timeout is None else timeout
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=settings.DB_BUSY_TIMEOUT_MS / 1000,
+                               check_same_thread=False, cached_statements=256)
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                try:
+                    return self._connect()
+                except Exception:
+                    self._created -= 1
+                    raise
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise PoolExhausted(f"no database connection became free within {self.timeout:g} s "
+                                f"(pool size {self.size})") from None
+
+    def release(self, conn):
+        if conn.in_transaction:
+            conn.rollback()
+        self._idle.put(conn)
+
+    def discard(self, conn):
+        conn.close()
+        with self._lock:
+            self._created -= 1
+
+    @contextmanager
+    def connection(self):
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self):
+        while True:
+            try:
+                self.discard(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+
+def _is_busy(exc):
+    message = str(exc).lower()
+    return "locked" in message or "busy" in message
+
+
+# Jalankan fungsi dengan retry + backoff kalau database sedang dikunci penulis lain
+def with_retry(func):
+    delay = 0.01
+    for attempt in range(_RETRIES):
+        try:
+            return func()
+        except sqlite3.OperationalError as exc:
+            if not _is_busy(exc) or attempt == _RETRIES - 1:
+                raise
+            time.sleep(delay)
+            delay *= 2
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    global _pool
+    if _pool is None or _pool.path != settings.DB_PATH:
+        with _pool_lock:
+            if _pool is None or _pool.path != settings.DB_PATH:
+                if _pool is not None:
+                    _pool.close()
+                _pool = ConnectionPool()
+    return _pool
+
+
+@contextmanager
+def connection():
+    with get_pool().connection() as conn:
+        yield conn
+
+
+def query_one(sql, params=()):
+    def run():
+        with connection() as conn:
+            return conn.execute(sql, params).fetchone()
+    return with_retry(run)
+
+
+def query_all(sql, params=()):
+    def run():
+        with connection() as conn:
+            return conn.execute(sql, params).fetchall()
+    return with_retry(run)
+
+
+# Satu statement dalam transaksi sendiri; mengembalikan cursor (lastrowid/rowcount)
+def execute(sql, params=()):
+    def run():
+        with connection() as conn, conn:
+            return conn.execute(sql, params)
+    return with_retry(run)
+
+
+def executemany(sql, rows):
+    def run():
+        with connection() as conn, conn:
+            return conn.executemany(sql, rows)
+    return with_retry(run)
+
+
+# Beberapa statement dalam satu transaksi: with db.transaction() as conn: ...
+@contextmanager
+def transaction():
+    with connection() as conn, conn:
+        yield conn
+
+
+def _benchmark(path, runs=2000):
+    import os
+    import shutil
+    import tempfile
+
+    directory = tempfile.mkdtemp()
+    try:
+        copy = os.path.join(directory, "bench.db")
+        shutil.copy(path, copy)
+        email = "Adminnocounter21021@gmail.com"
+        queries = {
+            "login lookup": ("SELECT * FROM users WHERE email = ?", (email,)),
+            "article page": ("SELECT * FROM articles", ()),
+        }
+
+        def per_call(sql, params):
+            conn = sqlite3.connect(copy)
+            c = conn.cursor()
+            c.execute(sql, params)
+            rows = c.fetchall()
+            conn.close()
+            return rows
+
+        settings.DB_PATH = copy
+        for name, (sql, params) in queries.items():
+            start = time.perf_counter()
+            for _ in range(runs):
+                per_call(sql, params)
+            before = (time.perf_counter() - start) / runs
+            query_all(sql, params)
+            start = time.perf_counter()
+            for _ in range(runs):
+                query_all(sql, params)
+            after = (time.perf_counter() - start) / runs
+            print(f"{name:>13}: connect per call {before * 1e6:.0f} us, pooled {after * 1e6:.0f} us "
+                  f"({before / after:.1f}x)")
+        get_pool().close()
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    _benchmark(settings.DB_PATH)
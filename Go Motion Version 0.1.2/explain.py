@@ -0,0 +1,77 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import numpy as np
+
+import features
+import metrics
+import model_registry
+import prediction_cache
+import settings
+
+# Atribusi fitur per prediksi dari ShapValues CatBoost. Dihitung di thread pool (bukan di
+# thread render), di-cache per vektor fitur, dan dilewati kalau melebihi anggaran latensi.
+# Perhitungan yang kena timeout tetap diselesaikan di background dan masuk cache.
+_executor = ThreadPoolExecutor(max_workers=settings.EXPLAIN_WORKERS, thread_name_prefix="explain")
+_cache = prediction_cache.PredictionCache(max_entries=settings.EXPLAIN_CACHE_MAX_ENTRIES)
+_lock = threading.Lock()
+_pending = {}
+
+latency = metrics.LatencyStats()
+skipped = 0
+failures = 0
+
+
+def _compute(row, version):
+    from catboost import Pool
+    with latency.time():
+        model = model_registry.get_model()
+        shap = np.asarray(model.get_feature_importance(Pool(row), type="ShapValues"))[0].copy()
+    _cache.put(row, version, (shap,))
+    return shap
+
+
+# SHAP tidak bisa dihitung untuk model ini (misalnya model surrogate tanpa get_feature_importance)
+class ExplainUnavailable(Exception):
+    pass
+
+
+# Matriks SHAP (kelas x fitur+bias) untuk satu baris, None kalau melebihi anggaran waktu,
+# atau ExplainUnavailable kalau perhitungannya gagal
+def shap_values(row, budget_ms=None):
+    global skipped, failures
+    budget_ms = settings.EXPLAIN_BUDGET_MS if budget_ms is None else budget_ms
+    version = model_registry.registry.version()
+    cached = _cache.get(row, version)
+    if cached is not None:
+        return cached[0]
+
+    key = (_cache.key(row), version)
+    with _lock:
+        future = _pending.get(key)
+        if future is None:
+            future = _executor.submit(_compute, np.array(row, dtype=np.float32), version)
+            _pending[key] = future
+            future.add_done_callback(lambda _: _pending.pop(key, None))
+    try:
+        return future.result(timeout=budget_ms / 1000)
+    except FutureTimeoutError:
+        skipped += 1
+    except Exception as exc:
+        failures += 1
+        raise ExplainUnavailable(str(exc) or type(exc).__name__) from exc
+    return None
+
+
+# Kontribusi tiap fitur terhadap kelas tertentu, diurutkan dari pengaruh terbesar
+def contributions(shap, label):
+    values = shap[int(label), :-1]
+    order = np.argsort(-np.abs(values))
+    return [(features.encoder.names[i], float(values[i])) for i in order]
+
+
+def stats():
+    stats = latency.snapshot()
+    stats.update({"skipped": skipped, "failures": failures, "cache": _cache.stats()})
+    return stats
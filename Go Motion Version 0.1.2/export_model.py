@@ -0,0 +1,72 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+import model_registry
+import settings
+
+# Ekspor model ke format native CatBoost dan bandingkan waktu muat serta memori:
+#   python export_model.py               -> tulis obesity_classifier.cbm di sebelah file .pkl
+#   python export_model.py --benchmark   -> cold load tiap format di proses baru
+
+_BENCHMARK_SNIPPET = """
+import json, os, resource, sys, time
+import catboost, model_registry
+
+def rss_kb():
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+before = rss_kb()
+start = time.perf_counter()
+model = model_registry.load_model_file(sys.argv[1])
+elapsed = time.perf_counter() - start
+print(json.dumps({"load_ms": elapsed * 1000, "rss_delta_kb": rss_kb() - before, "rss_kb": rss_kb()}))
+"""
+
+
+def export(source, target=None):
+    target = target or os.path.splitext(source)[0] + ".cbm"
+    model = model_registry.load_model_file(source)
+    model.save_model(target, format="cbm")
+    return target
+
+
+def benchmark(paths, runs=5):
+    results = {}
+    for path in paths:
+        samples = []
+        for _ in range(runs):
+            # Proses baru tiap run supaya yang diukur benar-benar cold load (import catboost tidak ikut dihitung)
+            output = subprocess.run([sys.executable, "-c", _BENCHMARK_SNIPPET, path], cwd=settings.BASE_DIR,
+                                    check=True, capture_output=True, text=True).stdout
+            samples.append(json.loads(output))
+        samples.sort(key=lambda sample: sample["load_ms"])
+        median = samples[len(samples) // 2]
+        results[model_registry.model_format(path)] = dict(median, size_kb=os.path.getsize(path) // 1024)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the obesity classifier to CatBoost's native format.")
+    parser.add_argument("--source", default=settings.MODEL_PATH)
+    parser.add_argument("--target", default=None)
+    parser.add_argument("--benchmark", action="store_true")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    target = export(args.source, args.target)
+    print(f"Wrote {target}")
+    if args.benchmark:
+        for name, result in benchmark([args.source, target], args.runs).items():
+            print(f"{name:>6}: load {result['load_ms']:.1f} ms, rss +{result['rss_delta_kb'] / 1024:.1f} MB "
+                  f"(total {result['rss_kb'] / 1024:.1f} MB), file {result['size_kb']} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+from collections import namedtuple
+
+import numpy as np
+
+# Skema fitur model klasifikasi obesitas. Urutan harus sama dengan urutan saat model dilatih.
+Feature = namedtuple("Feature", ["name", "minimum", "maximum", "step", "categories"])
+
+FEATURES = (
+    Feature("age", 1, 120, 1, None),
+    Feature("gender", None, None, None, {"Female": 0, "Male": 1}),
+    Feature("height", 0.5, 2.5, 0.01, None),
+    Feature("weight", 20, 200, 1, None),
+    Feature("calc", None, None, None, {"Never": 0, "Sometimes": 1, "Frequently": 2, "Always": 3}),
+    Feature("favc", None, None, None, {"No": 0, "Yes": 1}),
+    Feature("fcvc", 0, 10, 1, None),
+    Feature("ncp", 0, 10, 1, None),
+    Feature("scc", None, None, None, {"No": 0, "Yes": 1}),
+    Feature("smoke", None, None, None, {"No": 0, "Yes": 1}),
+    Feature("ch20", 0, 10, 0.1, None),
+    Feature("fhwo", None, None, None, {"No": 0, "Yes": 1}),
+    Feature("faf", 0, 7, 1, None),
+    Feature("tue", 0, 24, 1, None),
+    Feature("caec", None, None, None, {"No": 0, "Sometimes": 1, "Frequently": 2, "Always": 3}),
+    Feature("mtrans", None, None, None, {"Automobile": 0, "Motorbike": 1, "Bike": 2, "Public Transportation": 3, "Walking": 4}),
+)
+
+NUMERIC_FEATURES = tuple(feature.name for feature in FEATURES if feature.categories is None)
+
+HEALTH_STATUSES = ("Insufficient Weight", "Normal Weight", "Overweight Level 1", "Overweight Level 2",
+                   "Obesity Level 1", "Obesity Level 2", "Obesity Level 3")
+
+
+# Encoder dengan skema tetap: dict satu pengguna atau kolom batch -> array float32 kontigu
+class FeatureEncoder:
+    def __init__(self, schema=FEATURES):
+        self.schema = tuple(schema)
+        self.names = tuple(feature.name for feature in self.schema)
+
+    def encode(self, values):
+        row = np.empty((1, len(self.schema)), dtype=np.float32)
+        for i, feature in enumerate(self.schema):
+            if feature.name not in values:
+                raise ValueError(f"missing feature {feature.name!r}")
+            value = values[feature.name]
+            if feature.categories is not None:
+                if value not in feature.categories:
+                    raise ValueError(f"unknown {feature.name} value {value!r}")
+                row[0, i] = feature.categories[value]
+            else:
+                value = float(value)
+                if not feature.minimum <= value <= feature.maximum:
+                    raise ValueError(f"{feature.name} must be between {feature.minimum} and {feature.maximum}, got {value}")
+                row[0, i] = value
+        return row
+
+    # columns: mapping nama fitur -> sequence nilai; row_offset hanya dipakai untuk pesan error
+    def encode_batch(self, columns, row_offset=0):
+        missing = [name for name in self.names if name not in columns]
+        if missing:
+            raise ValueError(f"missing features: {', '.join(missing)}")
+        size = len(columns[self.names[0]])
+        matrix = np.empty((size, len(self.schema)), dtype=np.float32)
+        for i, feature in enumerate(self.schema):
+            column = np.asarray(columns[feature.name])
+            if len(column) != size:
+                raise ValueError(f"feature {feature.name!r} has {len(column)} rows, expected {size}")
+            if feature.categories is not None:
+                values, inverse = np.unique(column.astype(str), return_inverse=True)
+                unknown = [value for value in values if value not in feature.categories]
+                if unknown:
+                    row = int(np.flatnonzero(column.astype(str) == unknown[0])[0])
+                    raise ValueError(f"row {row_offset + row}: unknown {feature.name} value {str(unknown[0])!r}")
+                codes = np.array([feature.categories[value] for value in values], dtype=np.float32)
+                matrix[:, i] = codes[inverse.reshape(-1)]
+            else:
+                try:
+                    matrix[:, i] = column.astype(np.float32)
+                except ValueError:
+                    # Jalur lambat hanya untuk pesan error: cari baris pertama yang tidak bisa dikonversi
+                    for row, value in enumerate(column):
+                        try:
+                            float(value)
+                        except (TypeError, ValueError):
+                            raise ValueError(f"row {row_offset + row}: non-numeric {feature.name} value "
+                                             f"{str(value)!r}") from None
+                    raise
+                invalid = ~((matrix[:, i] >= feature.minimum) & (matrix[:, i] <= feature.maximum))
+                if invalid.any():
+                    row = int(np.flatnonzero(invalid)[0])
+                    raise ValueError(f"row {row_offset + row}: {feature.name} must be between "
+                                     f"{feature.minimum} and {feature.maximum}, got {str(column[row])}")
+        return matrix
+
+
+# Satu encoder dipakai bersama oleh form UI dan jalur batch
+encoder = FeatureEncoder()
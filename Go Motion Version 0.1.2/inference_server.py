@@ -0,0 +1,118 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError
+
+import numpy as np
+
+import metrics
+import model_registry
+import settings
+
+
+# Server inferensi in-process: request dari semua sesi diantrikan lalu digabung
+# menjadi satu panggilan predict_proba dalam jendela waktu tertentu.
+class BatchingPredictor:
+    def __init__(self, model_getter=None, max_batch_size=None, max_wait_ms=None, result_timeout=None):
+        self._model_getter = model_getter or model_registry.get_model
+        self.max_batch_size = max_batch_size or settings.BATCH_MAX_SIZE
+        self.max_wait = (settings.BATCH_MAX_WAIT_MS if max_wait_ms is None else max_wait_ms) / 1000
+        self.result_timeout = settings.BATCH_RESULT_TIMEOUT if result_timeout is None else result_timeout
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+        self.latency = metrics.LatencyStats()
+        self.batches = 0
+        self.rows = 0
+        self.fallbacks = 0
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="batching-predictor", daemon=True)
+                self._thread.start()
+        return self
+
+    # Kirim satu baris fitur, hasilnya (label, probabilitas) lewat Future
+    def submit(self, row):
+        self.start()
+        future = Future()
+        self._queue.put((np.asarray(row, dtype=np.float32), future, time.perf_counter()))
+        return future
+
+    # Kalau hasil batch tidak datang dalam batas waktu (thread worker mati atau macet), request ini
+    # di-predict langsung supaya tidak menggantung selamanya. Thread yang mati dihidupkan lagi oleh
+    # submit() berikutnya.
+    def predict(self, row, timeout=None):
+        future = self.submit(row)
+        try:
+            return future.result(self.result_timeout if timeout is None else timeout)
+        except TimeoutError:
+            self.fallbacks += 1
+            labels, probas = self._predict_rows(np.asarray(row, dtype=np.float32).reshape(1, -1))
+            return labels[0], probas[0]
+
+    def stats(self):
+        stats = self.latency.snapshot()
+        stats.update({
+            "batches": self.batches,
+            "rows": self.rows,
+            "mean_batch_size": self.rows / self.batches if self.batches else 0.0,
+            "queue_depth": self._queue.qsize(),
+            "fallbacks": self.fallbacks,
+        })
+        return stats
+
+    def _collect(self):
+        batch = [self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    # (label, probabilitas) untuk matriks fitur, satu panggilan predict_proba
+    def _predict_rows(self, rows):
+        model = self._model_getter()
+        probas = np.asarray(model.predict_proba(rows))
+        classes = getattr(model, "classes_", None)
+        if classes is None:
+            labels = np.asarray(model.predict(rows)).reshape(len(rows))
+        else:
+            labels = np.asarray(classes)[probas.argmax(axis=1)]
+        return labels, probas
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            try:
+                labels, probas = self._predict_rows(np.stack([row for row, _, _ in batch]))
+            except Exception as exc:
+                for _, future, _ in batch:
+                    future.set_exception(exc)
+                continue
+
+            self.batches += 1
+            self.rows += len(batch)
+            now = time.perf_counter()
+            for i, (_, future, queued_at) in enumerate(batch):
+                self.latency.record(now - queued_at)
+                # Salinan, supaya hasil yang disimpan cache prediksi tidak menahan seluruh array batch
+                future.set_result((labels[i], probas[i].copy()))
+
+
+# Satu predictor untuk seluruh proses
+predictor = BatchingPredictor()
+
+
+def predict(row, timeout=None):
+    return predictor.predict(row, timeout)
+
+
+def stats():
+    return predictor.stats()
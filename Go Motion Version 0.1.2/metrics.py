@@ -0,0 +1,61 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+# Menyimpan sampel latensi terakhir untuk menghitung persentil (p50/p99)
+class LatencyStats:
+    def __init__(self, window=2048):
+        self._lock = threading.Lock()
+        self._samples = deque(maxlen=window)
+        self.count = 0
+        self.total_seconds = 0.0
+
+    def record(self, seconds):
+        with self._lock:
+            self._samples.append(seconds)
+            self.count += 1
+            self.total_seconds += seconds
+
+    def percentile(self, p):
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return 0.0
+        index = min(len(samples) - 1, int(round(p / 100 * (len(samples) - 1))))
+        return samples[index]
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "p50_ms": self.percentile(50) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "mean_ms": self.total_seconds / self.count * 1000 if self.count else 0.0,
+        }
+
+    @contextmanager
+    def time(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(time.perf_counter() - start)
+
+
+# Statistik latensi bernama yang bertahan sepanjang proses. Dipakai dari app.py, yang dieksekusi
+# ulang oleh Streamlit di setiap rerun sehingga tidak bisa menyimpan state sendiri di level modul.
+_named = {}
+_named_lock = threading.Lock()
+
+
+def timer(name):
+    stats = _named.get(name)
+    if stats is None:
+        with _named_lock:
+            stats = _named.setdefault(name, LatencyStats())
+    return stats
+
+
+def snapshot(prefix=""):
+    return {name: stats.snapshot() for name, stats in sorted(_named.items()) if name.startswith(prefix)}
@@ -0,0 +1,104 @@
+import argparse
+import os
+import re
+import sqlite3
+
+import db
+import settings
+
+# Migrasi skema berversi. File migrations/NNNN_nama.sql dijalankan berurutan saat deploy:
+#   python migrations.py            -> terapkan migrasi yang belum dijalankan
+#   python migrations.py --status   -> tampilkan versi sekarang dan migrasi yang tertunda
+# Saat startup app hanya membandingkan nomor versi lewat check().
+MIGRATIONS_DIR = os.path.join(settings.BASE_DIR, "migrations")
+_FILENAME = re.compile(r"^(\d+)_(\w+)\.sql$")
+
+_checked_version = None
+
+
+def available():
+    migrations = []
+    for filename in os.listdir(MIGRATIONS_DIR):
+        match = _FILENAME.match(filename)
+        if match:
+            migrations.append((int(match.group(1)), match.group(2), os.path.join(MIGRATIONS_DIR, filename)))
+    return sorted(migrations)
+
+
+def latest_version():
+    migrations = available()
+    return migrations[-1][0] if migrations else 0
+
+
+# conn: koneksi yang sedang dipegang pemanggil (apply), supaya tidak meminta koneksi kedua dari pool
+def current_version(conn=None):
+    sql = "SELECT MAX(version) FROM schema_version"
+    try:
+        row = conn.execute(sql).fetchone() if conn is not None else db.query_one(sql)
+    except sqlite3.OperationalError as exc:
+        if "no such table" in str(exc):
+            return 0
+        raise
+    return row[0] or 0
+
+
+def pending(conn=None):
+    version = current_version(conn)
+    return [migration for migration in available() if migration[0] > version]
+
+
+# Setiap migrasi berjalan dalam satu transaksi bersama pencatatan versinya
+def apply():
+    applied = []
+    with db.connection() as conn:
+        conn.execute("""CREATE TABLE IF NOT EXISTS schema_version (
+                        version INTEGER PRIMARY KEY,
+                        name TEXT NOT NULL,
+                        applied_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP)""")
+        conn.commit()
+        for version, name, path in pending(conn):
+            with open(path, encoding="utf-8") as file:
+                script = file.read()
+            try:
+                conn.executescript(f"BEGIN IMMEDIATE;\n{script}\n"
+                                   f"INSERT INTO schema_version (version, name) VALUES ({version}, '{name}');\nCOMMIT;")
+            except sqlite3.Error:
+                if conn.in_transaction:
+                    conn.rollback()
+                raise
+            applied.append((version, name))
+    return applied
+
+
+# Dipanggil saat startup: cukup satu query versi per proses
+def check():
+    global _checked_version
+    expected = latest_version()
+    if _checked_version != expected:
+        version = current_version()
+        if version < expected:
+            raise RuntimeError(f"Database schema is at version {version} but the app needs {expected}. "
+                               f"Run 'python migrations.py' to apply pending migrations.")
+        _checked_version = expected
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply database schema migrations.")
+    parser.add_argument("--status", action="store_true", help="show the current version and pending migrations")
+    args = parser.parse_args(argv)
+
+    if args.status:
+        print(f"Database: {settings.DB_PATH}")
+        print(f"Current version: {current_version()}, latest: {latest_version()}")
+        for version, name, _ in pending():
+            print(f"  pending {version:04d}_{name}")
+        return
+
+    applied = apply()
+    for version, name in applied:
+        print(f"Applied {version:04d}_{name}")
+    print(f"Database schema is at version {current_version()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+-- Skema awal, sama dengan users.db yang sudah berjalan (articles belum NOT NULL)
+CREATE TABLE IF NOT EXISTS users
+    (id INTEGER PRIMARY KEY AUTOINCREMENT,
+     email TEXT UNIQUE,
+     password TEXT,
+     role TEXT);
+
+CREATE TABLE IF NOT EXISTS articles
+    (id INTEGER PRIMARY KEY AUTOINCREMENT,
+     title TEXT,
+     description TEXT,
+     image_url TEXT,
+     url TEXT);
+
+-- Akun admin default
+INSERT OR IGNORE INTO users (email, password, role)
+VALUES ('Adminnocounter21021@gmail.com', 'f23d28a9d7ef6b9820abcbf56e2317a1daeabbc69beaa1170fcdd90ef7e0ff57', 'admin');
@@ -0,0 +1,25 @@
+-- Kolom articles wajib diisi (NOT NULL), sesuai definisi di kode
+CREATE TEMP TABLE articles_seq AS SELECT seq FROM sqlite_sequence WHERE name = 'articles';
+
+CREATE TABLE articles_new (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    image_url TEXT NOT NULL,
+    url TEXT NOT NULL);
+
+INSERT INTO articles_new (id, title, description, image_url, url)
+SELECT id, COALESCE(title, ''), COALESCE(description, ''), COALESCE(image_url, ''), COALESCE(url, '')
+FROM articles;
+
+DROP TABLE articles;
+ALTER TABLE articles_new RENAME TO articles;
+
+-- Pertahankan nilai AUTOINCREMENT supaya id artikel yang sudah dihapus tidak dipakai ulang
+UPDATE sqlite_sequence SET seq = MAX(seq, (SELECT seq FROM articles_seq))
+WHERE name = 'articles' AND EXISTS (SELECT 1 FROM articles_seq);
+INSERT INTO sqlite_sequence (name, seq)
+SELECT 'articles', seq FROM articles_seq
+WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = 'articles');
+
+DROP TABLE articles_seq;
@@ -0,0 +1,21 @@
+-- Index full-text (FTS5) untuk pencarian judul dan deskripsi artikel
+CREATE VIRTUAL TABLE articles_fts USING fts5(
+    title, description,
+    content='articles', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2');
+
+INSERT INTO articles_fts (articles_fts) VALUES ('rebuild');
+
+-- Trigger menjaga index tetap sinkron dengan tabel articles
+CREATE TRIGGER articles_fts_insert AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, description) VALUES (new.id, new.title, new.description);
+END;
+
+CREATE TRIGGER articles_fts_delete AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+END;
+
+CREATE TRIGGER articles_fts_update AFTER UPDATE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+    INSERT INTO articles_fts (rowid, title, description) VALUES (new.id, new.title, new.description);
+END;
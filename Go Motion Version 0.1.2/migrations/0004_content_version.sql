@@ -0,0 +1,19 @@
+-- Penghitung versi konten, dinaikkan trigger di setiap perubahan articles.
+-- Dipakai cache artikel di semua proses server untuk tahu kapan datanya basi.
+CREATE TABLE content_version (
+    name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0);
+
+INSERT INTO content_version (name, version) VALUES ('articles', 0);
+
+CREATE TRIGGER articles_version_insert AFTER INSERT ON articles BEGIN
+    UPDATE content_version SET version = version + 1 WHERE name = 'articles';
+END;
+
+CREATE TRIGGER articles_version_update AFTER UPDATE ON articles BEGIN
+    UPDATE content_version SET version = version + 1 WHERE name = 'articles';
+END;
+
+CREATE TRIGGER articles_version_delete AFTER DELETE ON articles BEGIN
+    UPDATE content_version SET version = version + 1 WHERE name = 'articles';
+END;
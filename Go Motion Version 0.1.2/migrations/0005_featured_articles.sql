@@ -0,0 +1,47 @@
+-- Artikel pilihan untuk halaman landing: flag featured dan urutan tampil
+ALTER TABLE articles ADD COLUMN featured INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE articles ADD COLUMN position INTEGER NOT NULL DEFAULT 0;
+
+CREATE INDEX articles_featured ON articles (position, id) WHERE featured = 1;
+
+-- Index FTS hanya perlu diperbarui kalau judul/deskripsi berubah, bukan saat flag featured diubah
+DROP TRIGGER articles_fts_update;
+CREATE TRIGGER articles_fts_update AFTER UPDATE OF title, description ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+    INSERT INTO articles_fts (rowid, title, description) VALUES (new.id, new.title, new.description);
+END;
+
+-- Isi awal: lima rekomendasi yang sebelumnya ditulis langsung di display_articleslp()
+CREATE TEMP TABLE landing_seed (position INTEGER, title TEXT, description TEXT, image_url TEXT, url TEXT);
+INSERT INTO landing_seed VALUES
+    (1, 'Pentingnya Aktif Bergerak untuk Jaga Berharganya Kesehatan Tubuh',
+     'Tahukah kamu bahwa aktif bergerak tidak hanya baik untuk kesehatan tubuh tapi juga bagi kesehatan mental serta menjaga penampilan tetap prima?',
+     'https://www.anlene.com/content/dam/countries/indonesia/anlene_indonesia/article/1280-08.-anlene_followup_february2021_pentingnya-aktif-bergerak-untuk-jaga-berharganya-kesehatan-tubuh-rev.jpg',
+     'https://www.anlene.com/id/ms/pentingnya-aktif-bergerak.html'),
+    (2, '8 Macam Buah yang Ampuh Turunkan Kolesterol',
+     'Tubuh memproduksi kolesterol bukan tanpa alasan. Dalam proses pencernaan lemak makanan dan produksi sejumlah hormon seperti testosteron',
+     'https://www.anlene.com/content/dam/anlene/AnleneIDnew/buah_turunkan_kolesterol.jpg',
+     'https://www.anlene.com/id/ms/buah-penurun-kolesterol.html'),
+    (3, '4 Macam Penyakit Tulang Rapuh yang Harus Diwaspadai',
+     'Ketika mendengar kata penyakit tulang rapuh, kebanyakan dari kita pasti otomatis berpikir osteoporosis. Faktanya, osteoporosis bukanlah satu-satunya',
+     'https://www.anlene.com/content/dam/anlene/AnleneIDnew/01.%20Anlene_FollowUp_Oktober2021_4%20Macam%20Penyakit%20Tulang%20Rapuh%20yang%20Harus%20Diwaspadai%20.jpg',
+     'https://www.anlene.com/id/ms/penyakit-tulang-rapuh.html'),
+    (4, 'Dukung Orang Tua Jadi Lansia Prima, Ini 7 Rekomendasi Olahraga untuk Lansia!',
+     'Baik anak-anak, remaja, orang dewasa hingga orang tua, semua memiliki kebutuhan yang sama akan olahraga.',
+     'https://www.anlene.com/content/dam/countries/indonesia/anlene_indonesia/article_2/1280-09.-anlene_followup_mei2021_dukung-orang-tua-jadi-lansia-prima,-ini-7-rekomendasi-olahraga-untuk-lansia!.jpg',
+     'https://www.anlene.com/id/ms/olahraga-untuk-lansia.html'),
+    (5, 'Jangan Disepelekan! Ginjal Punya Fungsi Penting untuk Tubuh',
+     'Ginjal adalah organ tubuh yang terletak di bawah tulang rusuk bagian belakang, dekat bagian tengah punggung pada kedua sisi tulang belakang.',
+     'https://www.anlene.com/content/dam/anlene/AnleneIDnew/05.%20Anlene_FollowUp_March2022_Jangan%20Disepelekan!%20Ginjal%20Punya%20Fungsi%20Penting%20untuk%20Tubuh.jpg',
+     'https://www.anlene.com/id/ms/pentingnya-ginjal-untuk-tubuh.html');
+
+-- Artikel yang sudah ada (url sama) cukup ditandai, sisanya ditambahkan
+INSERT INTO articles (title, description, image_url, url)
+SELECT title, description, image_url, url FROM landing_seed
+WHERE NOT EXISTS (SELECT 1 FROM articles WHERE articles.url = landing_seed.url)
+ORDER BY position;
+
+UPDATE articles SET featured = 1, position = (SELECT position FROM landing_seed WHERE landing_seed.url = articles.url)
+WHERE url IN (SELECT url FROM landing_seed);
+
+DROP TABLE landing_seed;
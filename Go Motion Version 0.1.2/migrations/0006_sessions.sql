@@ -0,0 +1,19 @@
+-- Sesi login disimpan di database supaya token berlaku di semua proses server.
+-- Yang disimpan hanya hash SHA-256 dari id sesi, bukan id-nya sendiri.
+CREATE TABLE sessions (
+    sid_hash TEXT PRIMARY KEY,
+    email TEXT NOT NULL,
+    role TEXT NOT NULL,
+    expires REAL NOT NULL);
+
+CREATE INDEX sessions_email ON sessions (email);
+CREATE INDEX sessions_expires ON sessions (expires);
+
+-- Perubahan role/email atau penghapusan akun membatalkan semua sesi pengguna itu, dari jalur mana pun
+CREATE TRIGGER users_sessions_update AFTER UPDATE OF email, role ON users BEGIN
+    DELETE FROM sessions WHERE email = old.email;
+END;
+
+CREATE TRIGGER users_sessions_delete AFTER DELETE ON users BEGIN
+    DELETE FROM sessions WHERE email = old.email;
+END;
@@ -0,0 +1,162 @@
+import hashlib
+import mmap
+import os
+import pickle
+import threading
+import time
+import warnings
+
+import settings
+
+
+def model_format(path):
+    if path.endswith(".npz"):
+        return "surrogate"
+    return "cbm" if path.endswith(".cbm") else "pickle"
+
+
+# Path model bawaan sesuai GOMOTION_MODEL_VARIANT (model penuh atau surrogate)
+def default_model_path():
+    return settings.SURROGATE_PATH if settings.MODEL_VARIANT == "surrogate" else settings.MODEL_PATH
+
+
+_warned = set()
+
+
+# Pilih file yang dimuat: format native CatBoost (.cbm) di sebelah file .pkl diutamakan, tapi hanya kalau
+# tidak lebih tua dari .pkl. Pickle yang diperbarui setelah ekspor terakhir dipakai langsung (dengan
+# peringatan) sampai export_model.py dijalankan lagi, bukan diam-diam tertutup model lama.
+def resolve_model_path(path, preferred=None):
+    preferred = preferred or settings.MODEL_FORMAT
+    native = os.path.splitext(path)[0] + ".cbm"
+    if preferred not in ("auto", "cbm") or model_format(path) != "pickle":
+        return path
+    try:
+        native_mtime = os.stat(native).st_mtime_ns
+    except FileNotFoundError:
+        # Format cbm diminta secara eksplisit tapi filenya tidak ada: tetap jalan dengan pickle, tapi beri tahu
+        if preferred == "cbm" and native not in _warned:
+            _warned.add(native)
+            warnings.warn(f"GOMOTION_MODEL_FORMAT=cbm but {native} does not exist; loading the pickle. "
+                          "Run export_model.py to create it.")
+        return path
+    if native_mtime < os.stat(path).st_mtime_ns:
+        if native not in _warned:
+            _warned.add(native)
+            warnings.warn(f"{native} is older than {path}; loading the pickle. Run export_model.py to refresh it.")
+        return path
+    return native
+
+
+# Hash isi file lewat mmap supaya tidak perlu menyalin seluruh file ke memori Python
+def file_version(path):
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return hashlib.sha256(b"").hexdigest()[:12]
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return hashlib.sha256(data).hexdigest()[:12]
+
+
+def load_model_file(path):
+    if model_format(path) == "surrogate":
+        import surrogate
+        return surrogate.TreeSurrogate.load(path)
+    if model_format(path) == "cbm":
+        from catboost import CatBoostClassifier
+        return CatBoostClassifier().load_model(path, format="cbm")
+    with open(path, "rb") as file:
+        return pickle.load(file)
+
+
+# Registry model: setiap file model dimuat sekali per proses lalu dipakai bersama semua sesi Streamlit.
+# Model dimuat ulang otomatis kalau mtime/ukuran file berubah dan hash-nya juga berbeda.
+class ModelRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._warming = {}
+
+    def get(self, path=None):
+        return self._entry(path or default_model_path())["model"]
+
+    def info(self, path=None):
+        entry = self._entry(path or default_model_path())
+        return {
+            "path": entry["path"],
+            "source": entry["source"],
+            "format": entry["format"],
+            "version": entry["version"],
+            "loaded_at": entry["loaded_at"],
+            "load_seconds": entry["load_seconds"],
+            "reloads": entry["reloads"],
+        }
+
+    def version(self, path=None):
+        return self._entry(path or default_model_path())["version"]
+
+    # Muat model di thread terpisah supaya render pertama tidak ikut menunggu. app.py memanggil ini di
+    # setiap rerun, jadi thread hanya dibuat sekali per path per proses; panggilan berikutnya mengembalikan
+    # thread yang sama (reload karena file berubah tetap ditangani _entry saat model dipakai).
+    def warm(self, path=None, background=True):
+        path = path or default_model_path()
+        if not background:
+            self._entry(path)
+            return None
+        with self._lock:
+            thread = self._warming.get(path)
+            if thread is None:
+                thread = threading.Thread(target=self._entry, args=(path,), name="model-warmup", daemon=True)
+                self._warming[path] = thread
+                thread.start()
+        return thread
+
+    def _entry(self, path):
+        path = os.path.abspath(path)
+        source = resolve_model_path(path)
+        stat = os.stat(source)
+        entry = self._entries.get(path)
+        if entry and entry["source"] == source and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return entry
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry and entry["source"] == source and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                return entry
+
+            version = file_version(source)
+            if entry and entry["version"] == version:
+                # File disentuh tapi isinya sama, cukup perbarui metadata
+                entry = dict(entry, mtime=stat.st_mtime_ns, size=stat.st_size)
+            else:
+                start = time.perf_counter()
+                model = load_model_file(source)
+                entry = {
+                    "path": path,
+                    "source": source,
+                    "format": model_format(source),
+                    "model": model,
+                    "version": version,
+                    "mtime": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "loaded_at": time.time(),
+                    "load_seconds": time.perf_counter() - start,
+                    "reloads": entry["reloads"] + 1 if entry else 0,
+                }
+            self._entries[path] = entry
+            return entry
+
+
+# Satu registry untuk seluruh proses
+registry = ModelRegistry()
+
+
+def get_model(path=None):
+    return registry.get(path)
+
+
+def model_info(path=None):
+    return registry.info(path)
+
+
+def warm(path=None, background=True):
+    return registry.warm(path, background)
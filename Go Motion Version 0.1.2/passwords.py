@@ -0,0 +1,42 @@
+import hashlib
+import hmac
+import os
+import re
+
+import settings
+
+# Format hash: scrypt$n$r$p$salt_hex$hash_hex. Hash lama (SHA-256 tanpa salt, 64 hex)
+# masih diterima saat verifikasi dan ditandai untuk di-hash ulang.
+_LEGACY = re.compile(r"^[0-9a-f]{64}$")
+
+
+def hash_password(password, n=None, r=None, p=None):
+    n, r, p = n or settings.KDF_N, r or settings.KDF_R, p or settings.KDF_P
+    salt = os.urandom(16)
+    digest = hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p, maxmem=256 * n * r + 1024 * 1024, dklen=32)
+    return f"scrypt${n}${r}${p}${salt.hex()}${digest.hex()}"
+
+
+# Satu potongan import massal, dijalankan dalam satu panggilan worker
+def hash_many(passwords):
+    return [hash_password(password) for password in passwords]
+
+
+# Mengembalikan (cocok, perlu_hash_ulang)
+def verify_password(password, stored):
+    if not stored:
+        return False, False
+    if _LEGACY.match(stored):
+        ok = hmac.compare_digest(hashlib.sha256(password.encode()).hexdigest(), stored)
+        return ok, ok
+    try:
+        scheme, n, r, p, salt, digest = stored.split("$")
+        n, r, p = int(n), int(r), int(p)
+    except ValueError:
+        return False, False
+    if scheme != "scrypt":
+        return False, False
+    candidate = hashlib.scrypt(password.encode(), salt=bytes.fromhex(salt), n=n, r=r, p=p,
+                               maxmem=256 * n * r + 1024 * 1024, dklen=len(digest) // 2)
+    ok = hmac.compare_digest(candidate.hex(), digest)
+    return ok, ok and (n, r, p) != (settings.KDF_N, settings.KDF_R, settings.KDF_P)
@@ -0,0 +1,108 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+import inference_server
+import model_registry
+import settings
+
+
+# Cache LRU + TTL untuk hasil prediksi, dengan key vektor fitur yang sudah dikuantisasi.
+# Seluruh isi cache dibuang otomatis ketika versi model berubah.
+class PredictionCache:
+    def __init__(self, max_entries=None, ttl=None, max_bytes=None):
+        self.max_entries = max_entries or settings.PREDICTION_CACHE_MAX_ENTRIES
+        self.ttl = ttl or settings.PREDICTION_CACHE_TTL
+        self.max_bytes = max_bytes or settings.PREDICTION_CACHE_MAX_BYTES
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._version = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(row):
+        # Slider punya langkah minimal 0.01, jadi pembulatan 3 desimal menghapus noise float
+        return np.round(np.asarray(row, dtype=np.float32).reshape(-1), 3).tobytes()
+
+    def get(self, row, version):
+        key = self.key(row)
+        with self._lock:
+            self._check_version(version)
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, row, version, value):
+        key = self.key(row)
+        size = len(key) + sum(_sizeof(item) for item in value) + 64
+        with self._lock:
+            self._check_version(version)
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, value, size)
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _check_version(self, version):
+        if version != self._version:
+            self._entries.clear()
+            self._bytes = 0
+            self._version = version
+
+    def _remove(self, key):
+        self._bytes -= self._entries.pop(key)[2]
+
+
+# Perkiraan ukuran nilai; untuk array numpy hanya elemen milik array itu sendiri. View tetap menahan
+# seluruh buffer induknya, jadi nilai yang masuk cache harus berupa salinan (lihat inference_server).
+def _sizeof(item):
+    if isinstance(item, np.ndarray):
+        return item.nbytes + sys.getsizeof(item[:0])
+    return sys.getsizeof(item)
+
+
+cache = PredictionCache()
+
+
+# Prediksi satu baris: cek cache dulu, baru kirim ke server inferensi kalau miss
+def predict(row):
+    version = model_registry.registry.version()
+    result = cache.get(row, version)
+    if result is None:
+        result = inference_server.predict(np.asarray(row, dtype=np.float32).reshape(-1))
+        cache.put(row, version, result)
+    return result
+
+
+def stats():
+    return cache.stats()
@@ -0,0 +1,44 @@
+import time
+
+import numpy as np
+
+import metrics
+import model_registry
+import prediction_cache
+import settings
+
+# Live preview klasifikasi saat slider digeser. Inferensi langsung ke model yang sudah hangat
+# (tanpa jendela tunggu micro-batching) dan memakai cache prediksi yang sama dengan form.
+latency = metrics.LatencyStats()
+
+
+def predict(row):
+    start = time.perf_counter()
+    version = model_registry.registry.version()
+    result = prediction_cache.cache.get(row, version)
+    if result is None:
+        model = model_registry.get_model()
+        probas = np.asarray(model.predict_proba(row))[0]
+        result = (model.classes_[probas.argmax()], probas)
+        prediction_cache.cache.put(row, version, result)
+    elapsed = time.perf_counter() - start
+    latency.record(elapsed)
+    return result, elapsed
+
+
+# Debounce: kalau update sebelumnya masih dalam jendela debounce, tunggu dulu. Streamlit
+# menghentikan run ini di perintah st berikutnya jika ada input baru selama menunggu,
+# sehingga inferensi hanya jalan setelah input berhenti berubah.
+def debounce(state, key="preview_last_update"):
+    now = time.monotonic()
+    last = state.get(key)
+    state[key] = now
+    if last is not None and now - last < settings.PREVIEW_DEBOUNCE_MS / 1000:
+        time.sleep(settings.PREVIEW_DEBOUNCE_MS / 1000)
+
+
+def stats():
+    stats = latency.snapshot()
+    stats["budget_ms"] = settings.PREVIEW_BUDGET_MS
+    stats["within_budget"] = stats["p99_ms"] <= settings.PREVIEW_BUDGET_MS
+    return stats
@@ -0,0 +1,110 @@
+import argparse
+import csv
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import features
+import model_registry
+import settings
+
+# Scoring CSV besar tanpa UI:
+#   python score.py in.csv out.csv [--chunk-size N] [--workers N]
+
+# Encode satu chunk (list baris string) lewat encoder yang sama dengan form UI
+def encode_chunk(rows, indices, first_line):
+    raw = np.array(rows, dtype=object)[:, indices]
+    columns = {name: raw[:, j] for j, name in enumerate(features.encoder.names)}
+    return features.encoder.encode_batch(columns, row_offset=first_line)
+
+
+_model_path = None
+
+
+def _score_chunk(rows, indices, first_line):
+    encoded = encode_chunk(rows, indices, first_line)
+    model = model_registry.get_model(_model_path)
+    return np.asarray(model.predict(encoded)).reshape(len(rows)).astype(int)
+
+
+def _init_worker(model_path):
+    global _model_path
+    _model_path = model_path
+    model_registry.get_model(model_path)
+
+
+# Baris yang jumlah kolomnya beda dengan header ditolak di sini, sebelum dikirim ke worker
+def _read_chunks(reader, chunk_size, width):
+    chunk = []
+    first_line = 2
+    for row in reader:
+        if len(row) != width:
+            raise ValueError(f"line {reader.line_num}: expected {width} columns, got {len(row)}")
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield first_line, chunk
+            first_line += len(chunk)
+            chunk = []
+    if chunk:
+        yield first_line, chunk
+
+
+def score_csv(in_path, out_path, chunk_size=None, workers=None):
+    chunk_size = chunk_size or settings.SCORE_CHUNK_SIZE
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    total = 0
+
+    with open(in_path, newline="") as infile, open(out_path, "w", newline="") as outfile:
+        reader = csv.reader(infile)
+        header = next(reader)
+        lookup = {name.strip().lower(): i for i, name in enumerate(header)}
+        missing = [name for name in features.encoder.names if name not in lookup]
+        if missing:
+            raise ValueError(f"missing columns: {', '.join(missing)}")
+        indices = [lookup[name] for name in features.encoder.names]
+
+        writer = csv.writer(outfile)
+        writer.writerow(header + ["prediction", "health_status"])
+
+        # Batasi chunk yang sedang diproses supaya memori tetap datar
+        pending = deque()
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(model_registry.default_model_path(),)) as pool:
+            for first_line, rows in _read_chunks(reader, chunk_size, len(header)):
+                pending.append((rows, pool.submit(_score_chunk, rows, indices, first_line)))
+                if len(pending) >= workers * 2:
+                    total += _write_chunk(writer, *pending.popleft())
+            while pending:
+                total += _write_chunk(writer, *pending.popleft())
+
+    return total, time.perf_counter() - start
+
+
+def _write_chunk(writer, rows, future):
+    labels = future.result()
+    writer.writerows(row + [label, features.HEALTH_STATUSES[label]] for row, label in zip(rows, labels))
+    return len(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score a CSV of intake rows with the obesity classifier.")
+    parser.add_argument("input")
+    parser.add_argument("output")
+    parser.add_argument("--chunk-size", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    try:
+        total, elapsed = score_csv(args.input, args.output, args.chunk_size, args.workers)
+    except ValueError as exc:
+        parser.exit(1, f"error: {exc}\n")
+    rate = total / elapsed if elapsed else 0.0
+    print(f"Scored {total} rows in {elapsed:.2f} s ({rate:,.0f} rows/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
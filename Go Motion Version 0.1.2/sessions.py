@@ -0,0 +1,169 @@
+import base64
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+import db
+import settings
+
+# Token sesi bertanda tangan (HMAC-SHA256) yang disimpan di cookie klien, dengan store sesi di tabel
+# sessions (migrasi 0006) supaya berlaku di semua proses server. Token hanya berlaku selama sesinya
+# masih ada di store, sehingga logout atau perubahan role (trigger di tabel users) membatalkannya.
+# Di depan tabel ada cache TTL/LRU per proses: refresh halaman dan cek ulang berkala biasanya tidak
+# menyentuh SQLite. Pembatalan dari proses lain terlihat paling lambat setelah SESSION_CACHE_TTL.
+
+
+_cached_secret = None
+
+
+# Secret dari environment, atau file acak yang dibuat sekali dan dipakai bersama semua proses
+def _secret():
+    global _cached_secret
+    if settings.SESSION_SECRET:
+        return settings.SESSION_SECRET.encode()
+    if _cached_secret is None:
+        try:
+            fd = os.open(settings.SESSION_SECRET_PATH, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            pass
+        else:
+            with os.fdopen(fd, "wb") as file:
+                file.write(secrets.token_bytes(32))
+        with open(settings.SESSION_SECRET_PATH, "rb") as file:
+            _cached_secret = file.read()
+    return _cached_secret
+
+
+def _b64encode(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64decode(text):
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def sign(payload):
+    body = _b64encode(json.dumps(payload, separators=(",", ":")).encode())
+    signature = _b64encode(hmac.new(_secret(), body.encode(), hashlib.sha256).digest())
+    return f"{body}.{signature}"
+
+
+def unsign(token):
+    try:
+        body, signature = token.split(".")
+        expected = _b64encode(hmac.new(_secret(), body.encode(), hashlib.sha256).digest())
+        if not hmac.compare_digest(signature, expected):
+            return None
+        payload = json.loads(_b64decode(body))
+        if payload["exp"] < time.time():
+            return None
+    except (ValueError, AttributeError, KeyError, TypeError):
+        return None
+    return payload
+
+
+def _sid_hash(sid):
+    return hashlib.sha256(sid.encode()).hexdigest()
+
+
+class SessionStore:
+    def __init__(self, ttl=None, cache_ttl=None, max_entries=None):
+        self.ttl = ttl or settings.SESSION_TTL
+        self.cache_ttl = settings.SESSION_CACHE_TTL if cache_ttl is None else cache_ttl
+        self.max_entries = max_entries or settings.SESSION_CACHE_MAX_ENTRIES
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0
+
+    def _remember(self, sid, expires, email, role):
+        with self._lock:
+            self._cache[sid] = (expires, email, role, time.monotonic())
+            self._cache.move_to_end(sid)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def create(self, email, role):
+        sid = secrets.token_urlsafe(16)
+        now = time.time()
+        expires = now + self.ttl
+        with db.transaction() as conn:
+            conn.execute("DELETE FROM sessions WHERE expires < ?", (now,))
+            conn.execute("INSERT INTO sessions (sid_hash, email, role, expires) VALUES (?, ?, ?, ?)",
+                         (_sid_hash(sid), email, role, expires))
+        self._remember(sid, expires, email, role)
+        return sign({"sid": sid, "exp": int(expires)})
+
+    # Token -> (email, role), atau None kalau tanda tangan salah, kedaluwarsa, atau sesi sudah dibatalkan.
+    # Entri cache yang lebih muda dari cache_ttl dipakai tanpa query; selain itu dibaca dari tabel.
+    def resolve(self, token):
+        payload = unsign(token) if token else None
+        if payload is None:
+            self.rejected += 1
+            return None
+        sid, now = payload["sid"], time.time()
+        with self._lock:
+            entry = self._cache.get(sid)
+            if entry is not None and entry[0] >= now and time.monotonic() - entry[3] < self.cache_ttl:
+                self._cache.move_to_end(sid)
+                self.hits += 1
+                return entry[1], entry[2]
+            self._cache.pop(sid, None)
+        self.misses += 1
+        row = db.query_one("SELECT email, role, expires FROM sessions WHERE sid_hash = ? AND expires >= ?",
+                           (_sid_hash(sid), now))
+        if row is None:
+            self.rejected += 1
+            return None
+        self._remember(sid, row[2], row[0], row[1])
+        return row[0], row[1]
+
+    def invalidate(self, token):
+        payload = unsign(token) if token else None
+        if payload:
+            with self._lock:
+                self._cache.pop(payload["sid"], None)
+            db.execute("DELETE FROM sessions WHERE sid_hash = ?", (_sid_hash(payload["sid"]),))
+
+    # Batalkan semua sesi milik satu pengguna, di tabel dan di cache proses ini. Trigger di tabel users
+    # sudah menghapus barisnya saat role/email berubah; tanpa ini cache masih melayani role lama
+    # sampai cache_ttl habis.
+    def invalidate_user(self, email):
+        with self._lock:
+            for sid in [sid for sid, entry in self._cache.items() if entry[1] == email]:
+                del self._cache[sid]
+        db.execute("DELETE FROM sessions WHERE email = ?", (email,))
+
+    def stats(self):
+        row = db.query_one("SELECT COUNT(*) FROM sessions WHERE expires >= ?", (time.time(),))
+        return {"sessions": row[0], "cached": len(self._cache), "hits": self.hits, "misses": self.misses,
+                "rejected": self.rejected}
+
+
+store = SessionStore()
+
+
+def create(email, role):
+    return store.create(email, role)
+
+
+def resolve(token):
+    return store.resolve(token)
+
+
+def invalidate(token):
+    store.invalidate(token)
+
+
+def invalidate_user(email):
+    store.invalidate_user(email)
+
+
+def stats():
+    return store.stats()
@@ -0,0 +1,109 @@
+import os
+
+# Konfigurasi aplikasi, bisa di-override lewat environment variable
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+MODEL_PATH = os.environ.get("GOMOTION_MODEL_PATH", os.path.join(BASE_DIR, "obesity_classifier.pkl"))
+
+# Micro-batching inference: ukuran batch maksimum, jendela tunggu (milidetik), dan batas tunggu hasil
+# (detik) sebelum request jatuh ke predict langsung
+BATCH_MAX_SIZE = int(os.environ.get("GOMOTION_BATCH_MAX_SIZE", "64"))
+BATCH_MAX_WAIT_MS = float(os.environ.get("GOMOTION_BATCH_MAX_WAIT_MS", "5"))
+BATCH_RESULT_TIMEOUT = float(os.environ.get("GOMOTION_BATCH_RESULT_TIMEOUT", "10"))
+
+# Batch scoring CSV: jumlah baris per chunk
+SCORE_CHUNK_SIZE = int(os.environ.get("GOMOTION_SCORE_CHUNK_SIZE", "20000"))
+
+# Cache prediksi: jumlah entri, TTL (detik), dan batas memori (byte)
+PREDICTION_CACHE_MAX_ENTRIES = int(os.environ.get("GOMOTION_PREDICTION_CACHE_MAX_ENTRIES", "10000"))
+PREDICTION_CACHE_TTL = float(os.environ.get("GOMOTION_PREDICTION_CACHE_TTL", "3600"))
+PREDICTION_CACHE_MAX_BYTES = int(os.environ.get("GOMOTION_PREDICTION_CACHE_MAX_BYTES", str(8 * 1024 * 1024)))
+
+# Format model yang dimuat: "auto" (pakai .cbm kalau ada, selain itu pickle), "cbm", atau "pickle"
+MODEL_FORMAT = os.environ.get("GOMOTION_MODEL_FORMAT", "auto")
+
+# Live preview: jeda debounce dan anggaran latensi inferensi per update (milidetik)
+PREVIEW_DEBOUNCE_MS = float(os.environ.get("GOMOTION_PREVIEW_DEBOUNCE_MS", "150"))
+PREVIEW_BUDGET_MS = float(os.environ.get("GOMOTION_PREVIEW_BUDGET_MS", "10"))
+
+# What-if explorer: jumlah titik maksimum per sumbu grid
+WHATIF_GRID_STEPS = int(os.environ.get("GOMOTION_WHATIF_GRID_STEPS", "50"))
+
+# Atribusi fitur (SHAP): anggaran latensi (milidetik), jumlah worker, dan ukuran cache
+EXPLAIN_BUDGET_MS = float(os.environ.get("GOMOTION_EXPLAIN_BUDGET_MS", "250"))
+EXPLAIN_WORKERS = int(os.environ.get("GOMOTION_EXPLAIN_WORKERS", "2"))
+EXPLAIN_CACHE_MAX_ENTRIES = int(os.environ.get("GOMOTION_EXPLAIN_CACHE_MAX_ENTRIES", "2000"))
+
+# Model yang dilayani app: "full" (CatBoost) atau "surrogate" (pohon hasil distilasi)
+MODEL_VARIANT = os.environ.get("GOMOTION_MODEL_VARIANT", "full")
+SURROGATE_PATH = os.environ.get("GOMOTION_SURROGATE_PATH", os.path.join(BASE_DIR, "obesity_surrogate.npz"))
+
+# Database SQLite: lokasi file, ukuran pool koneksi, busy timeout (milidetik), dan batas tunggu koneksi
+# bebas dari pool (detik)
+DB_PATH = os.environ.get("GOMOTION_DB_PATH", os.path.join(BASE_DIR, "users.db"))
+DB_POOL_SIZE = int(os.environ.get("GOMOTION_DB_POOL_SIZE", "8"))
+DB_BUSY_TIMEOUT_MS = int(os.environ.get("GOMOTION_DB_BUSY_TIMEOUT_MS", "5000"))
+DB_POOL_TIMEOUT = float(os.environ.get("GOMOTION_DB_POOL_TIMEOUT", "30"))
+
+# Hash password (scrypt): parameter KDF, jumlah worker proses, batas antrean, dan timeout antre (detik)
+KDF_N = int(os.environ.get("GOMOTION_KDF_N", str(2 ** 14)))
+KDF_R = int(os.environ.get("GOMOTION_KDF_R", "8"))
+KDF_P = int(os.environ.get("GOMOTION_KDF_P", "1"))
+KDF_WORKERS = int(os.environ.get("GOMOTION_KDF_WORKERS", str(min(4, os.cpu_count() or 1))))
+KDF_MAX_PENDING = int(os.environ.get("GOMOTION_KDF_MAX_PENDING", "64"))
+KDF_QUEUE_TIMEOUT = float(os.environ.get("GOMOTION_KDF_QUEUE_TIMEOUT", "10"))
+
+# Sesi login: secret untuk menandatangani token, TTL (detik), nama cookie, seberapa sering (detik) sesi
+# yang sedang terbuka dicek ulang (logout/perubahan role di tempat lain), dan cache sesi per proses di
+# depan tabel sessions (umur entri dalam detik, jumlah entri maksimum)
+SESSION_SECRET = os.environ.get("GOMOTION_SESSION_SECRET")
+SESSION_SECRET_PATH = os.environ.get("GOMOTION_SESSION_SECRET_PATH", os.path.join(BASE_DIR, ".session_secret"))
+SESSION_TTL = float(os.environ.get("GOMOTION_SESSION_TTL", str(12 * 3600)))
+SESSION_COOKIE = os.environ.get("GOMOTION_SESSION_COOKIE", "gomotion_session")
+SESSION_CHECK_SECONDS = float(os.environ.get("GOMOTION_SESSION_CHECK_SECONDS", "60"))
+SESSION_CACHE_TTL = float(os.environ.get("GOMOTION_SESSION_CACHE_TTL", "300"))
+SESSION_CACHE_MAX_ENTRIES = int(os.environ.get("GOMOTION_SESSION_CACHE_MAX_ENTRIES", "10000"))
+
+# Import pengguna massal: jumlah baris per transaksi
+BULK_CHUNK_SIZE = int(os.environ.get("GOMOTION_BULK_CHUNK_SIZE", "1000"))
+
+# Pembatasan login (token bucket): kapasitas burst dan laju isi ulang (token per detik)
+LOGIN_EMAIL_BURST = float(os.environ.get("GOMOTION_LOGIN_EMAIL_BURST", "5"))
+LOGIN_EMAIL_RATE = float(os.environ.get("GOMOTION_LOGIN_EMAIL_RATE", str(1 / 30)))
+LOGIN_CLIENT_BURST = float(os.environ.get("GOMOTION_LOGIN_CLIENT_BURST", "20"))
+LOGIN_CLIENT_RATE = float(os.environ.get("GOMOTION_LOGIN_CLIENT_RATE", str(1 / 3)))
+THROTTLE_IDLE_SECONDS = float(os.environ.get("GOMOTION_THROTTLE_IDLE_SECONDS", "600"))
+# Jumlah reverse proxy tepercaya di depan server; 0 = abaikan header X-Forwarded-For
+TRUSTED_PROXY_HOPS = int(os.environ.get("GOMOTION_TRUSTED_PROXY_HOPS", "0"))
+
+# Jumlah artikel per halaman (keyset pagination), untuk pembaca dan untuk tabel edit massal di halaman admin
+ARTICLES_PAGE_SIZE = int(os.environ.get("GOMOTION_ARTICLES_PAGE_SIZE", "6"))
+ADMIN_ARTICLES_PAGE_SIZE = int(os.environ.get("GOMOTION_ADMIN_ARTICLES_PAGE_SIZE", "500"))
+
+# Thumbnail artikel: folder cache, batas ukuran cache (byte), lebar thumbnail, timeout unduh, jeda
+# sebelum URL yang gagal dicoba lagi (detik), dan satu-satunya folder tempat gambar lokal boleh dibaca
+THUMBNAIL_DIR = os.environ.get("GOMOTION_THUMBNAIL_DIR", os.path.join(BASE_DIR, ".cache", "thumbnails"))
+THUMBNAIL_CACHE_MAX_BYTES = int(os.environ.get("GOMOTION_THUMBNAIL_CACHE_MAX_BYTES", str(200 * 1024 * 1024)))
+THUMBNAIL_WIDTH = int(os.environ.get("GOMOTION_THUMBNAIL_WIDTH", "640"))
+THUMBNAIL_FETCH_TIMEOUT = float(os.environ.get("GOMOTION_THUMBNAIL_FETCH_TIMEOUT", "10"))
+THUMBNAIL_RETRY_SECONDS = float(os.environ.get("GOMOTION_THUMBNAIL_RETRY_SECONDS", "300"))
+ARTICLE_IMAGE_DIR = os.environ.get("GOMOTION_ARTICLE_IMAGE_DIR", os.path.join(BASE_DIR, "articles"))
+
+# Cache baca artikel: seberapa sering (detik) versi konten di database dicek, dan jumlah entri maksimum
+ARTICLE_CACHE_CHECK_SECONDS = float(os.environ.get("GOMOTION_ARTICLE_CACHE_CHECK_SECONDS", "2"))
+ARTICLE_CACHE_MAX_ENTRIES = int(os.environ.get("GOMOTION_ARTICLE_CACHE_MAX_ENTRIES", "256"))
+
+# Rekomendasi artikel di halaman landing: jumlah kartu, panjang deskripsi, dan interval cek versi (detik)
+LANDING_ARTICLES = int(os.environ.get("GOMOTION_LANDING_ARTICLES", "6"))
+LANDING_DESCRIPTION_CHARS = int(os.environ.get("GOMOTION_LANDING_DESCRIPTION_CHARS", "160"))
+LANDING_CACHE_CHECK_SECONDS = float(os.environ.get("GOMOTION_LANDING_CACHE_CHECK_SECONDS", "60"))
+
+# Aset halaman (Lottie, gambar latar): lokasi cache disk, timeout unduh, interval revalidasi ETag,
+# jeda sebelum mencoba lagi setelah gagal (detik), dan lebar maksimum gambar latar
+ASSET_DIR = os.environ.get("GOMOTION_ASSET_DIR", os.path.join(BASE_DIR, ".cache", "assets"))
+ASSET_FETCH_TIMEOUT = float(os.environ.get("GOMOTION_ASSET_FETCH_TIMEOUT", "5"))
+ASSET_REVALIDATE_SECONDS = float(os.environ.get("GOMOTION_ASSET_REVALIDATE_SECONDS", str(24 * 3600)))
+ASSET_RETRY_SECONDS = float(os.environ.get("GOMOTION_ASSET_RETRY_SECONDS", "300"))
+ASSET_BACKGROUND_WIDTH = int(os.environ.get("GOMOTION_ASSET_BACKGROUND_WIDTH", "1920"))
+# Folder yang disajikan Streamlit di app/static/ (harus bernama static, di sebelah app.py)
+STATIC_DIR = os.path.join(BASE_DIR, "static")
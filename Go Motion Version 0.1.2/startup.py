@@ -0,0 +1,110 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import settings
+
+# Profil waktu impor dan benchmark cold start aplikasi Streamlit:
+#   python startup.py importtime                 -> rincian -X importtime untuk "import app", per paket teratas
+#   python startup.py benchmark                  -> waktu sampai render pertama halaman landing di proses baru
+#   python startup.py benchmark --compare        -> sama, dibandingkan dengan impor eager seperti sebelum lazy import
+
+# Dependensi yang dulu diimpor app.py di top level, dipakai sebagai pembanding di benchmark
+EAGER_IMPORTS = ["plotly.express", "plotly.graph_objects", "requests", "streamlit_lottie", "streamlit_option_menu",
+                 "catboost"]
+
+_BENCHMARK_SNIPPET = """
+import importlib, json, sys, time
+start = time.perf_counter()
+for name in filter(None, sys.argv[2].split(",")):
+    importlib.import_module(name)
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file(sys.argv[1], default_timeout=float(sys.argv[3]))
+app.run()
+elapsed = time.perf_counter() - start
+print(json.dumps({"first_render_ms": elapsed * 1000, "exception": bool(app.exception),
+                  "modules": len(sys.modules)}))
+"""
+
+
+# Parse stderr -X importtime menjadi list (kedalaman, nama modul, self us, cumulative us)
+def parse_importtime(text):
+    rows = []
+    for line in text.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((depth, name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def _run(args, **kwargs):
+    result = subprocess.run(args, cwd=settings.BASE_DIR, capture_output=True, text=True, **kwargs)
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        raise RuntimeError(lines[-1] if lines else f"exit status {result.returncode}")
+    return result
+
+
+# Modul yang diimpor langsung oleh module (anak kedalaman 1), urut waktu kumulatif. -X importtime
+# mencetak anak sebelum induknya, jadi anak-anaknya adalah baris setelah root sebelumnya.
+def importtime(module="app", top=15):
+    rows = parse_importtime(_run([sys.executable, "-X", "importtime", "-c", f"import {module}"]).stderr)
+    end = max(index for index, row in enumerate(rows) if row[0] == 0 and row[1] == module)
+    start = max([index for index, row in enumerate(rows[:end]) if row[0] == 0], default=-1) + 1
+    children = [row for row in rows[start:end] if row[0] == 1]
+    print(f"import {module}: {rows[end][3] / 1000:.0f} ms, {end - start + 1} modules")
+    print(f"{'cumulative':>12} {'self':>9}  module")
+    for _, name, self_us, cumulative_us in sorted(children, key=lambda row: -row[3])[:top]:
+        print(f"{cumulative_us / 1000:>9.1f} ms {self_us / 1000:>6.1f} ms  {name}")
+    return children
+
+
+def benchmark(runs=5, preload=(), timeout=60):
+    path = os.path.join(settings.BASE_DIR, "app.py")
+    args = [sys.executable, "-c", _BENCHMARK_SNIPPET, path, ",".join(preload), str(timeout)]
+    # Satu run tanpa dihitung supaya cache aset/thumbnail di disk dan page cache OS sudah terisi
+    _run(args)
+    renders, walls = [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        output = _run(args).stdout
+        walls.append((time.perf_counter() - start) * 1000)
+        result = json.loads(output.strip().splitlines()[-1])
+        if result["exception"]:
+            raise RuntimeError("app.py raised an exception on the landing page")
+        renders.append(result["first_render_ms"])
+    label = f"preload {','.join(preload)}" if preload else "lazy imports"
+    print(f"{label}: first render median {statistics.median(renders):.0f} ms (min {min(renders):.0f} ms), "
+          f"process wall median {statistics.median(walls):.0f} ms, {result['modules']} modules loaded")
+    return renders
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile import time and cold-start latency of the app.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    profile = subparsers.add_parser("importtime", help="per-package -X importtime breakdown")
+    profile.add_argument("--module", default="app")
+    profile.add_argument("--top", type=int, default=15)
+    bench = subparsers.add_parser("benchmark", help="time to first render of the landing page in a fresh process")
+    bench.add_argument("--runs", type=int, default=5)
+    bench.add_argument("--preload", default="", help="comma-separated modules to import first, e.g. the old eager set")
+    bench.add_argument("--compare", action="store_true", help=f"also run with --preload {','.join(EAGER_IMPORTS)}")
+    args = parser.parse_args(argv)
+
+    if args.command == "importtime":
+        importtime(args.module, args.top)
+        return
+    lazy = benchmark(args.runs, [name for name in args.preload.split(",") if name])
+    if args.compare:
+        eager = benchmark(args.runs, EAGER_IMPORTS)
+        print(f"speedup: {statistics.median(eager) / statistics.median(lazy):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+import functools
+import re
+
+# CSS statis halaman (gaya kotak, tombol, kartu artikel, dan animasi). Disimpan di modul yang diimpor,
+# bukan di app.py yang dieksekusi ulang setiap rerun, jadi teksnya diringkas sekali per proses dan
+# blok <style> lengkap di-cache per URL gambar latar.
+CSS = """
+.stApp {
+    background-size: cover;
+    background-repeat: no-repeat;
+    background-attachment: fixed;
+    transition: background 0.5s ease;
+    color: #ffffff; /* Warna putih */
+}
+.title-box {
+    text-align: center;
+    margin-top: 2rem;
+    animation: fadeInDown 1s ease;
+}
+.title-box h1 {
+    font-size: 3rem;
+    color: #ffffff; /* Warna putih */
+    text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.5); /* Efek bayangan */
+    margin: 0;
+}
+.info-box {
+    text-align: center;
+    margin-top: 2rem;
+    color: #ffffff; /* Warna putih */
+    background: rgba(0, 0, 0, 0.7); /* Warna hitam transparan */
+    padding: 1rem;
+    border-radius: 1rem;
+    box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2); /* Bayangan */
+    animation: fadeInUp 1s ease;
+}
+.center-buttons {
+    display: flex;
+    justify-content: center;
+    align-items: center;
+    margin-top: 4rem;
+}
+.center-buttons button {
+    font-weight: bold;
+    font-size: 1.1rem;
+    padding: 0.5rem 1rem;
+    background-color: #ff69b4; /* Warna pink */
+    color: white;
+    border: none;
+    border-radius: 5px;
+    cursor: pointer;
+    margin: 0 0.5rem;
+    transition: background-color 0.3s ease, transform 0.3s ease; /* Efek transisi */
+    box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2); /* Bayangan */
+}
+.center-buttons button:hover {
+    background-color: #ff1493; /* Warna pink lebih gelap */
+    transform: scale(1.05); /* Efek perbesaran */
+}
+.center-buttons button:active {
+    transform: scale(0.95); /* Efek pengecilan saat diklik */
+}
+.extra-box {
+    text-align: center;
+    margin-top: 1rem;
+    color: #ffffff; /* Warna putih */
+    background: rgba(0, 0, 0, 0.7); /* Warna hitam transparan */
+    padding: 1rem;
+    border-radius: 1rem;
+    box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2); /* Bayangan */
+    animation: fadeIn 1.5s ease;
+}
+.top-menu {
+    display: flex;
+    justify-content: flex-end;
+    background: rgba(0, 0, 0, 0.7); /* Warna hitam transparan */
+    padding: 0.5rem 1rem;
+    position: sticky;
+    top: 0;
+    z-index: 1000;
+    animation: slideDown 0.5s ease;
+}
+.top-menu a {
+    color: #fff;
+    margin: 0 1rem;
+    text-decoration: none;
+    font-weight: bold;
+    transition: color 0.3s ease; /* Efek transisi */
+}
+.top-menu a:hover {
+    color: #ff69b4; /* Warna pink */
+}
+.button-container {
+    display: flex;
+    justify-content: center;
+    margin-top: 4rem;
+}
+.button-container .stButton {
+    margin: 0 0.5rem;
+}
+.article-container {
+    background: rgba(50, 50, 50, 0.9);
+    border-radius: 10px;
+    padding: 10px;
+    margin-top: 10px;
+    text-align: center;
+    box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2); /* Bayangan */
+    animation: fadeIn 1.5s ease;
+}
+.article-container img {
+    border-radius: 10px;
+    transition: transform 0.3s ease; /* Efek transisi */
+}
+.article-container img:hover {
+    transform: scale(1.05); /* Efek perbesaran */
+}
+/* Animasi */
+@keyframes fadeIn {
+    from { opacity: 0; }
+    to { opacity: 1; }
+}
+@keyframes fadeInDown {
+    from { opacity: 0; transform: translateY(-20px); }
+    to { opacity: 1; transform: translateY(0); }
+}
+@keyframes fadeInUp {
+    from { opacity: 0; transform: translateY(20px); }
+    to { opacity: 1; transform: translateY(0); }
+}
+@keyframes slideDown {
+    from { opacity: 0; transform: translateY(-50px); }
+    to { opacity: 1; transform: translateY(0); }
+}
+"""
+
+
+# Buang komentar dan spasi berlebih; ukuran ini yang dikirim ke browser pada setiap rerun penuh
+def _minify(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};:,>])\s*", r"\1", css).strip()
+
+
+MINIFIED = _minify(CSS)
+
+
+# Satu elemen <style> berisi latar belakang + CSS statis
+@functools.lru_cache(maxsize=8)
+def stylesheet(background):
+    return f'<style>.stApp{{background-image:url("{background}");}}{MINIFIED}</style>'
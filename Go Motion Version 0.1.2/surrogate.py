@@ -0,0 +1,218 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+import features
+import model_registry
+import settings
+
+# Model pengganti (surrogate) yang ringkas: satu pohon keputusan NumPy hasil distilasi dari
+# CatBoost. Antarmukanya sama (predict, predict_proba, classes_) supaya bisa dipakai app.
+#   python surrogate.py              -> latih dari model penuh (seed 0), tulis obesity_surrogate.npz, cetak benchmark
+#   python surrogate.py --seeds 5    -> sama, plus sebaran agreement untuk 5 sampel sintetis (seed 0..4)
+
+
+class TreeSurrogate:
+    def __init__(self, feature, threshold, left, right, value, classes, depth):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.classes_ = classes
+        self.depth = int(depth)
+
+    @property
+    def nbytes(self):
+        return sum(array.nbytes for array in (self.feature, self.threshold, self.left, self.right, self.value, self.classes_))
+
+    # Semua baris ditelusuri bersamaan; daun menunjuk ke dirinya sendiri jadi cukup diulang sedalam pohon
+    def predict_proba(self, X):
+        X = np.asarray(X, dtype=np.float32).reshape(-1, len(features.FEATURES))
+        if len(X) == 1:
+            # Jalur cepat satu baris (form/preview): telusuri dengan skalar Python
+            row, node = X[0].tolist(), 0
+            while self.feature[node] >= 0:
+                node = self.left[node] if row[self.feature[node]] <= self.threshold[node] else self.right[node]
+            return self.value[node:node + 1]
+        rows = np.arange(len(X))
+        node = np.zeros(len(X), dtype=np.int32)
+        for _ in range(self.depth):
+            feature = self.feature[node]
+            go_left = X[rows, np.maximum(feature, 0)] <= self.threshold[node]
+            node = np.where(go_left, self.left[node], self.right[node])
+        return self.value[node]
+
+    def predict(self, X):
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            np.savez(file, feature=self.feature, threshold=self.threshold, left=self.left, right=self.right,
+                     value=self.value, classes=self.classes_, depth=self.depth)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(data["feature"], data["threshold"], data["left"], data["right"], data["value"],
+                       data["classes"], data["depth"])
+
+
+# Split terbaik (gini) untuk satu node, dicari di semua fitur dengan cumsum jumlah kelas
+def _best_split(X, Y, min_leaf):
+    n = len(X)
+    total = Y.sum(axis=0)
+    left_n = np.arange(1, n, dtype=np.float64)[:, None]
+    best = (1 - ((total / n) ** 2).sum(), None, None)
+    for f in range(X.shape[1]):
+        order = np.argsort(X[:, f], kind="stable")
+        xs = X[order, f]
+        left = np.cumsum(Y[order], axis=0)[:-1]
+        right = total - left
+        gini = (left_n[:, 0] * (1 - ((left / left_n) ** 2).sum(axis=1))
+                + (n - left_n[:, 0]) * (1 - ((right / (n - left_n)) ** 2).sum(axis=1))) / n
+        valid = (xs[:-1] != xs[1:]) & (left_n[:, 0] >= min_leaf) & (n - left_n[:, 0] >= min_leaf)
+        if not valid.any():
+            continue
+        i = int(np.argmin(np.where(valid, gini, np.inf)))
+        if gini[i] < best[0] - 1e-12:
+            best = (gini[i], f, (xs[i] + xs[i + 1]) / 2)
+    return best[1], best[2]
+
+
+def train_tree(X, labels, classes, max_depth=12, min_leaf=20):
+    Y = (labels[:, None] == classes[None, :]).astype(np.float64)
+    feature, threshold, left, right, value = [], [], [], [], []
+
+    def new_node(rows):
+        counts = Y[rows].sum(axis=0)
+        feature.append(-1)
+        threshold.append(0.0)
+        left.append(len(left))
+        right.append(len(right))
+        value.append(counts / counts.sum())
+        return len(feature) - 1
+
+    stack = [(new_node(np.arange(len(X))), np.arange(len(X)), 0)]
+    while stack:
+        node, rows, depth = stack.pop()
+        if depth >= max_depth or len(rows) < 2 * min_leaf or value[node].max() == 1.0:
+            continue
+        f, t = _best_split(X[rows], Y[rows], min_leaf)
+        if f is None:
+            continue
+        mask = X[rows, f] <= t
+        feature[node], threshold[node] = f, t
+        left[node] = new_node(rows[mask])
+        right[node] = new_node(rows[~mask])
+        stack.append((left[node], rows[mask], depth + 1))
+        stack.append((right[node], rows[~mask], depth + 1))
+
+    return TreeSurrogate(np.array(feature, dtype=np.int32), np.array(threshold, dtype=np.float32),
+                         np.array(left, dtype=np.int32), np.array(right, dtype=np.int32),
+                         np.array(value, dtype=np.float32), np.asarray(classes), max_depth)
+
+
+# Sampel sintetis di ruang input form: nilai numerik mengikuti langkah slider, kategori seragam
+def synthetic_sample(size, seed=0):
+    rng = np.random.default_rng(seed)
+    X = np.empty((size, len(features.FEATURES)), dtype=np.float32)
+    for j, feature in enumerate(features.FEATURES):
+        if feature.categories is None:
+            steps = int(round((feature.maximum - feature.minimum) / feature.step))
+            X[:, j] = feature.minimum + rng.integers(0, steps + 1, size) * feature.step
+        else:
+            X[:, j] = rng.choice(sorted(feature.categories.values()), size)
+    return X
+
+
+def distill(teacher, train_size=200000, test_size=50000, max_depth=12, min_leaf=20, seed=0):
+    X = synthetic_sample(train_size + test_size, seed)
+    labels = np.asarray(teacher.predict(X)).reshape(-1)
+    tree = train_tree(X[:train_size], labels[:train_size], np.asarray(teacher.classes_), max_depth, min_leaf)
+    agreement = float((tree.predict(X[train_size:]) == labels[train_size:]).mean())
+    return tree, agreement
+
+
+# Memori resident model yang sudah dimuat, diukur di proses baru: RSS sesudah mengimpor runtime-nya
+# (numpy, ditambah catboost untuk model penuh) dan tambahan RSS sesudah file model dimuat
+_RSS_SNIPPET = """
+import json, sys
+def rss():
+    with open("/proc/self/status") as file:
+        for line in file:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+import numpy
+import model_registry
+base = rss()
+if model_registry.model_format(sys.argv[1]) != "surrogate":
+    import catboost
+runtime = rss()
+model = model_registry.load_model_file(sys.argv[1])
+print(json.dumps({"runtime": runtime - base, "model": rss() - runtime}))
+"""
+
+
+def resident_memory(path):
+    result = subprocess.run([sys.executable, "-c", _RSS_SNIPPET, path], cwd=settings.BASE_DIR,
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def benchmark(model, X, single_runs=1000):
+    row = X[:1]
+    start = time.perf_counter()
+    for _ in range(single_runs):
+        model.predict_proba(row)
+    single = (time.perf_counter() - start) / single_runs
+    start = time.perf_counter()
+    model.predict_proba(X)
+    batch = time.perf_counter() - start
+    return {"single_ms": single * 1000, "batch_rows_per_s": len(X) / batch}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Distill the obesity classifier into a compact decision tree.")
+    parser.add_argument("--output", default=settings.SURROGATE_PATH)
+    parser.add_argument("--train-size", type=int, default=200000)
+    parser.add_argument("--test-size", type=int, default=50000)
+    parser.add_argument("--max-depth", type=int, default=12)
+    parser.add_argument("--min-leaf", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0, help="seed of the synthetic sample for the saved tree")
+    parser.add_argument("--seeds", type=int, default=1, help="also distill with the next seeds and report the spread")
+    args = parser.parse_args(argv)
+
+    teacher = model_registry.load_model_file(settings.MODEL_PATH)
+    start = time.perf_counter()
+    tree, agreement = distill(teacher, args.train_size, args.test_size, args.max_depth, args.min_leaf, args.seed)
+    print(f"Trained {len(tree.feature)} nodes in {time.perf_counter() - start:.1f} s, "
+          f"agreement with full model on {args.test_size} held-out rows (seed {args.seed}): {agreement:.2%}")
+    tree.save(args.output)
+
+    # Agreement bergantung pada sampel sintetis; laporkan sebarannya, bukan satu angka
+    if args.seeds > 1:
+        agreements = [agreement]
+        for seed in range(args.seed + 1, args.seed + args.seeds):
+            agreements.append(distill(teacher, args.train_size, args.test_size, args.max_depth, args.min_leaf, seed)[1])
+        print(f"Agreement over seeds {args.seed}..{args.seed + args.seeds - 1}: "
+              f"min {min(agreements):.2%}, mean {np.mean(agreements):.2%}, max {max(agreements):.2%} "
+              f"({', '.join(f'{value:.2%}' for value in agreements)})")
+
+    X = synthetic_sample(10000, seed=1)
+    for name, model, path in (("full", teacher, settings.MODEL_PATH), ("surrogate", tree, args.output)):
+        result = benchmark(model, X)
+        memory = resident_memory(path)
+        print(f"{name:>9}: single row {result['single_ms']:.3f} ms, batch {result['batch_rows_per_s']:,.0f} rows/s, "
+              f"file {os.path.getsize(path) / 1024:.0f} KB, resident model {memory['model'] / 1024:.0f} KB "
+              f"(+{memory['runtime'] / 1024 / 1024:.1f} MB runtime imports)")
+    print(f"Surrogate arrays in memory: {tree.nbytes / 1024:.0f} KB. Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+import hashlib
+import io
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+
+import settings
+
+# Pipeline thumbnail gambar artikel: setiap image_url diunduh sekali, diperkecil ke lebar grid,
+# lalu disimpan di cache disk dengan batas ukuran (eviction LRU berdasarkan waktu akses terakhir).
+# Klien HTTP bisa diganti (fetch(url, timeout) -> bytes), misalnya ke server stub lokal (python thumbnails.py).
+# URL yang gagal diingat selama THUMBNAIL_RETRY_SECONDS supaya CDN yang lambat/mati tidak membuat setiap
+# render menunggu timeout untuk setiap gambar.
+
+
+def requests_fetch(url, timeout):
+    import requests
+    response = requests.get(url, timeout=timeout)
+    response.raise_for_status()
+    return response.content
+
+
+# Path file untuk image_url lokal (relatif terhadap BASE_DIR, misalnya articles/foto.jpg). Path absolut,
+# ../, atau symlink yang keluar dari ARTICLE_IMAGE_DIR ditolak supaya image_url tidak bisa dipakai
+# untuk membaca file lain di server.
+def local_image_path(url):
+    root = os.path.realpath(settings.ARTICLE_IMAGE_DIR)
+    path = os.path.realpath(os.path.join(settings.BASE_DIR, url))
+    if os.path.commonpath([root, path]) != root:
+        raise ValueError(f"image path outside {settings.ARTICLE_IMAGE_DIR}: {url}")
+    return path
+
+
+class ThumbnailCache:
+    def __init__(self, directory=None, max_bytes=None, width=None, fetch=None, timeout=None, retry_seconds=None):
+        self.directory = directory or settings.THUMBNAIL_DIR
+        self.max_bytes = max_bytes or settings.THUMBNAIL_CACHE_MAX_BYTES
+        self.width = width or settings.THUMBNAIL_WIDTH
+        self.fetch = fetch or requests_fetch
+        self.timeout = timeout or settings.THUMBNAIL_FETCH_TIMEOUT
+        self.retry_seconds = settings.THUMBNAIL_RETRY_SECONDS if retry_seconds is None else retry_seconds
+        self._format = None
+        self._lock = threading.Lock()
+        self._url_locks = {}
+        self._backlog = deque()
+        self._queued = set()
+        self._worker = None
+        self._failed_at = {}
+        self._sizes = None
+        self.hits = 0
+        self.misses = 0
+        self.failures = 0
+        self.skipped = 0
+
+    # Format output (WebP kalau Pillow mendukungnya) dipilih saat pertama dipakai, bukan di __init__,
+    # supaya mengimpor modul ini (dan article_store) tidak ikut memuat PIL
+    def _pick_format(self):
+        if self._format is None:
+            from PIL import features
+            self._format = ("WEBP", ".webp") if features.check("webp") else ("JPEG", ".jpg")
+        return self._format
+
+    @property
+    def format(self):
+        return self._pick_format()[0]
+
+    @property
+    def extension(self):
+        return self._pick_format()[1]
+
+    def path_for(self, url):
+        name = hashlib.sha256(f"{url}|{self.width}".encode()).hexdigest()
+        return os.path.join(self.directory, name + self.extension)
+
+    # Path thumbnail yang sudah ada di disk, atau None; tidak pernah mengunduh
+    def cached(self, url):
+        path = self.path_for(url)
+        if self._touch(path):
+            self.hits += 1
+            return path
+        return None
+
+    # Isi cache untuk urls di satu thread latar belakang, jadi render tidak pernah menunggu unduhan
+    def prefetch(self, urls):
+        with self._lock:
+            for url in urls:
+                if url not in self._queued:
+                    self._queued.add(url)
+                    self._backlog.append(url)
+            if self._backlog and self._worker is None:
+                self._worker = threading.Thread(target=self._drain, name="thumbnail-prefetch", daemon=True)
+                self._worker.start()
+
+    def _drain(self):
+        while True:
+            with self._lock:
+                if not self._backlog:
+                    self._worker = None
+                    return
+                url = self._backlog.popleft()
+            try:
+                self.get(url)
+            finally:
+                with self._lock:
+                    self._queued.discard(url)
+
+    # Path thumbnail lokal untuk url, atau None kalau gambar gagal diunduh/diproses
+    def get(self, url):
+        path = self.path_for(url)
+        if self._touch(path):
+            self.hits += 1
+            return path
+        if time.monotonic() - self._failed_at.get(url, float("-inf")) < self.retry_seconds:
+            self.skipped += 1
+            return None
+
+        with self._lock:
+            url_lock = self._url_locks.setdefault(path, threading.Lock())
+        with url_lock:
+            if self._touch(path):
+                self.hits += 1
+                return path
+            if url in self._failed_at:
+                # Thread lain baru saja gagal mengunduh url ini
+                self.skipped += 1
+                return None
+            self.misses += 1
+            try:
+                data = self._render(self._load(url))
+            except Exception:
+                self.failures += 1
+                with self._lock:
+                    self._failed_at[url] = time.monotonic()
+                    self._prune_failures()
+                return None
+            finally:
+                with self._lock:
+                    self._url_locks.pop(path, None)
+            self._failed_at.pop(url, None)
+            self._store(path, data)
+            return path
+
+    def _load(self, url):
+        if url.startswith(("http://", "https://")):
+            return self.fetch(url, self.timeout)
+        with open(local_image_path(url), "rb") as file:
+            return file.read()
+
+    def _render(self, data):
+        from PIL import Image
+        with Image.open(io.BytesIO(data)) as image:
+            image = image.convert("RGB")
+            if image.width > self.width:
+                image = image.resize((self.width, round(image.height * self.width / image.width)), Image.LANCZOS)
+            output = io.BytesIO()
+            image.save(output, self.format, quality=80)
+        return output.getvalue()
+
+    def _touch(self, path):
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _store(self, path, data):
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(tmp, path)
+        with self._lock:
+            sizes = self._load_sizes()
+            sizes[path] = len(data)
+            if sum(sizes.values()) > self.max_bytes:
+                self._evict(sizes)
+            self._prune_failures()
+
+    def _load_sizes(self):
+        if self._sizes is None:
+            self._sizes = {}
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(self.extension):
+                    self._sizes[entry.path] = entry.stat().st_size
+        return self._sizes
+
+    # Hapus file yang paling lama tidak diakses sampai ukuran cache di bawah batas
+    def _evict(self, sizes):
+        total = sum(sizes.values())
+        by_age = sorted(sizes, key=lambda path: os.stat(path).st_mtime if os.path.exists(path) else 0)
+        for path in by_age:
+            if total <= self.max_bytes:
+                break
+            total -= sizes.pop(path)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    # Lupakan kegagalan yang jeda retry-nya sudah lewat, supaya _failed_at tidak tumbuh tanpa batas
+    def _prune_failures(self):
+        cutoff = time.monotonic() - self.retry_seconds
+        for url in [url for url, failed_at in self._failed_at.items() if failed_at < cutoff]:
+            del self._failed_at[url]
+
+    def stats(self):
+        sizes = self._sizes or {}
+        return {"files": len(sizes), "bytes": sum(sizes.values()), "hits": self.hits, "misses": self.misses,
+                "failures": self.failures, "skipped": self.skipped}
+
+
+cache = ThumbnailCache()
+
+
+# Sumber gambar untuk st.image: thumbnail lokal kalau tersedia, selain itu URL aslinya
+def image(url):
+    path = cache.cached(url)
+    if path is None:
+        cache.prefetch([url])
+    return path or url
+
+
+def prefetch(urls):
+    cache.prefetch(urls)
+
+
+# Cek cache terhadap server HTTP stub lokal: unduh + resize, hit dari disk, dan backoff untuk URL
+# yang timeout/404 (percobaan kedua harus langsung kembali tanpa menunggu timeout lagi)
+def _selftest():
+    import http.server
+    import shutil
+
+    from PIL import Image
+
+    output = io.BytesIO()
+    Image.new("RGB", (1600, 900), (200, 40, 120)).save(output, "PNG")
+    png = output.getvalue()
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/slow.png":
+                time.sleep(2)
+            if self.path in ("/ok.png", "/slow.png"):
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(png)))
+                self.end_headers()
+                self.wfile.write(png)
+            else:
+                self.send_error(404)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    directory = tempfile.mkdtemp()
+    try:
+        thumbs = ThumbnailCache(directory=directory, width=320, timeout=0.5, retry_seconds=60)
+        path = thumbs.get(base + "/ok.png")
+        with Image.open(path) as thumbnail:
+            assert thumbnail.width == 320, thumbnail.size
+        assert thumbs.get(base + "/ok.png") == path and thumbs.hits == 1
+        for name in ("/slow.png", "/missing.png"):
+            assert thumbs.get(base + name) is None
+            start = time.perf_counter()
+            assert thumbs.get(base + name) is None
+            assert time.perf_counter() - start < 0.05, "failed URL was fetched again"
+        print(f"thumbnail self-test passed: {thumbs.stats()}")
+    finally:
+        server.shutdown()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    _selftest()
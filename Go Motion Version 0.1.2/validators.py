@@ -0,0 +1,18 @@
+# Fungsi Validasi
+def check_uppercase(password):
+    return any(c.isupper() for c in password)
+
+def check_lowercase(password):
+    return any(c.islower() for c in password)
+
+def check_digit(password):
+    return any(c.isdigit() for c in password)
+
+def check_no_symbols(password):
+    return password.isalnum()
+
+def is_valid_password(password):
+    return check_uppercase(password) and check_lowercase(password) and check_digit(password) and check_no_symbols(password)
+
+def is_valid_email(email):
+    return email.endswith('@gmail.com')
@@ -0,0 +1,39 @@
+import time
+
+import numpy as np
+
+import features
+import model_registry
+import settings
+
+# What-if explorer: variasikan dua fitur numerik di sekitar input pengguna dan
+# skor seluruh grid dengan satu panggilan predict_proba.
+_SCHEMA = {feature.name: (i, feature) for i, feature in enumerate(features.FEATURES)}
+
+
+# Nilai sumbu mengikuti langkah slider; kalau terlalu banyak, diambil sampel merata
+def axis(name, steps=None):
+    steps = steps or settings.WHATIF_GRID_STEPS
+    feature = _SCHEMA[name][1]
+    if feature.categories is not None:
+        raise ValueError(f"{name} is not a numeric feature")
+    values = np.arange(feature.minimum, feature.maximum + feature.step / 2, feature.step)
+    if len(values) > steps:
+        values = np.round(np.linspace(feature.minimum, feature.maximum, steps) / feature.step) * feature.step
+    return values.astype(np.float32)
+
+
+def grid(row, x_name, y_name, steps=None, model=None):
+    if x_name == y_name:
+        raise ValueError("choose two different features")
+    start = time.perf_counter()
+    xs, ys = axis(x_name, steps), axis(y_name, steps)
+    matrix = np.repeat(np.asarray(row, dtype=np.float32).reshape(1, -1), len(xs) * len(ys), axis=0)
+    grid_x, grid_y = np.meshgrid(xs, ys)
+    matrix[:, _SCHEMA[x_name][0]] = grid_x.ravel()
+    matrix[:, _SCHEMA[y_name][0]] = grid_y.ravel()
+
+    model = model or model_registry.get_model()
+    probas = np.asarray(model.predict_proba(matrix))
+    labels = np.asarray(model.classes_)[probas.argmax(axis=1)].reshape(len(ys), len(xs))
+    return xs, ys, labels, time.perf_counter() - start